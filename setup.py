@@ -59,10 +59,13 @@ setup(
     install_requires=[],
     extras_require={
         "faker": ["faker>=18.0.0"],
+        "parquet": ["pyarrow>=8.0.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-benchmark>=4.0.0",
+            "pytest-xdist>=3.0.0",
+            "orjson>=3.6.0",
             "memory-profiler>=0.60.0",
             "psutil>=5.9.0",
             "black>=22.0.0",
@@ -73,10 +76,13 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-benchmark>=4.0.0",
+            "pytest-xdist>=3.0.0",
+            "orjson>=3.6.0",
             "memory-profiler>=0.60.0",
             "psutil>=5.9.0",
         ],
         "performance": [
+            "orjson>=3.6.0",
             "memory-profiler>=0.60.0",
             "psutil>=5.9.0",
             "pytest-benchmark>=4.0.0",
@@ -8,6 +8,9 @@ from .core.generator import DataGenerator
 from .core.utils.data_frame import TempDataFrame
 from .core.io.csv_handler import read_csv as _read_csv
 from .core.io.json_handler import read_json as _read_json
+# Dataset modules are imported eagerly because the registry below holds the
+# classes themselves. They only define pools and schemas at import time;
+# Faker is not imported until the first dataset instance needs it.
 from .core.datasets.crm import CrmDataset
 from .core.datasets.customers import CustomersDataset
 from .core.datasets.ecommerce import EcommerceDataset
@@ -56,7 +59,7 @@ from .core.datasets.performance import PerformanceDataset
 from .core.exceptions import (
     TempDatasetError, DatasetNotFoundError, DataGenerationError,
     ValidationError, CSVReadError, CSVWriteError, JSONReadError, JSONWriteError,
-    FileOperationError, MemoryError as TempDatasetMemoryError
+    ParquetWriteError, FileOperationError, MemoryError as TempDatasetMemoryError
 )
 
 # Initialize the main generator
@@ -109,7 +112,10 @@ _generator.register_dataset('user_sessions', UserSessionsDataset)
 _generator.register_dataset('error_logs', ErrorLogsDataset)
 _generator.register_dataset('performance', PerformanceDataset)
 
-def create_dataset(dataset_type: str, rows: int = 500):
+# The registry is fixed from here on
+_generator.freeze()
+
+def create_dataset(dataset_type: str, rows: int = 500, stream: bool = False):
     """
     Generate temporary datasets or save to files.
     
@@ -122,11 +128,15 @@ def create_dataset(dataset_type: str, rows: int = 500):
             'patients', 'appointments', 'lab_results', 'prescriptions', 'medical_history', 'clinical_trials',
             'social_media', 'user_profiles', 'web_analytics', 'app_usage', 'system_logs', 'api_calls', 
             'server_metrics', 'user_sessions', 'error_logs', 'performance'
-            Or filename with extension: 'data.csv', 'data.json'
+            Or filename with extension: 'data.csv', 'data.json', 'data.parquet'
+            (Parquet output requires pyarrow: pip install tempdataset[parquet])
         rows: Number of rows to generate (default: 500)
+        stream: If True and dataset_type is a filename, write rows straight to
+            the file without building a TempDataFrame (default: False)
         
     Returns:
-        TempDataFrame containing the generated data (also saves to file if filename provided)
+        TempDataFrame containing the generated data (also saves to file if filename provided),
+        or None when stream is True
         
     Raises:
         ValidationError: If parameters are invalid
@@ -135,9 +145,10 @@ def create_dataset(dataset_type: str, rows: int = 500):
         TempDatasetMemoryError: If memory limits are exceeded
         CSVWriteError: If CSV file writing fails
         JSONWriteError: If JSON file writing fails
+        ParquetWriteError: If Parquet file writing fails
     """
     # Use the generator's validation and error handling
-    return _generator.generate(dataset_type, rows)
+    return _generator.generate(dataset_type, rows, stream)
 
 
 def read_csv(filename: str) -> TempDataFrame:
@@ -161,7 +172,7 @@ def read_csv(filename: str) -> TempDataFrame:
     if not filename.strip():
         raise ValidationError("filename", filename, "non-empty string")
     
-    if not filename.lower().endswith('.csv'):
+    if not (filename.endswith(('.csv', '.CSV')) or filename[-4:].lower() == '.csv'):
         raise ValidationError("filename", filename, "filename with .csv extension")
     
     # Use the CSV handler's validation and error handling
@@ -189,7 +200,7 @@ def read_json(filename: str) -> TempDataFrame:
     if not filename.strip():
         raise ValidationError("filename", filename, "non-empty string")
     
-    if not filename.lower().endswith('.json'):
+    if not (filename.endswith(('.json', '.JSON')) or filename[-5:].lower() == '.json'):
         raise ValidationError("filename", filename, "filename with .json extension")
     
     # Use the JSON handler's validation and error handling
@@ -7,7 +7,7 @@ import argparse
 import sys
 from typing import Optional
 
-from . import create_dataset, help as show_help, list_datasets, __version__
+from . import create_dataset, help as show_help, list_datasets, __version__, _generator
 
 
 def main(args: Optional[list] = None) -> int:
@@ -149,13 +149,23 @@ Examples:
         if parsed_args.verbose:
             print(f"Generating {parsed_args.rows} rows of {parsed_args.dataset_type} data...")
         
+        is_file = '.' in parsed_args.dataset_type and any(parsed_args.dataset_type.endswith(ext) for ext in ['.csv', '.json', '.parquet'])
+        
+        # File output only needs the in-memory frame for the verbose summary
+        if is_file and not parsed_args.verbose:
+            create_dataset(parsed_args.dataset_type, parsed_args.rows, stream=True)
+            num_columns = len(_generator.get_schema(parsed_args.dataset_type))
+            print(f"Generated {parsed_args.rows} rows with {num_columns} columns")
+            print(f"Data saved to: {parsed_args.dataset_type}")
+            return 0
+        
         result = create_dataset(parsed_args.dataset_type, parsed_args.rows)
         
         # Always show the data summary 
         print(f"Generated {len(result)} rows with {len(result.columns)} columns")
         
         # If it's a filename (has extension), mention the file was saved
-        if '.' in parsed_args.dataset_type and any(parsed_args.dataset_type.endswith(ext) for ext in ['.csv', '.json']):
+        if is_file:
             print(f"Data saved to: {parsed_args.dataset_type}")
         
         if parsed_args.verbose:
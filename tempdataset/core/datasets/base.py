@@ -5,10 +5,33 @@ Provides the abstract interface that all dataset generators must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Tuple, Callable
 import random
 
 
+@lru_cache(maxsize=None)
+def row_factory(columns: Tuple[str, ...]) -> Callable[..., Dict[str, Any]]:
+    """
+    Build a function that turns one value per column into a row dictionary.
+    
+    The function is generated with the column names baked in as a dict
+    literal, so each call builds the row in a single step instead of
+    zipping names and values. Factories are cached per column tuple.
+    
+    Args:
+        columns: Column names in row order
+        
+    Returns:
+        Function taking len(columns) positional values and returning the row
+    """
+    params = ', '.join('v%d' % i for i in range(len(columns)))
+    items = ', '.join('%r: v%d' % (col, i) for i, col in enumerate(columns))
+    namespace = {}
+    exec('def make_row(%s):\n    return {%s}\n' % (params, items), namespace)
+    return namespace['make_row']
+
+
 class BaseDataset(ABC):
     """
     Abstract base class for all dataset generators.
@@ -37,6 +60,42 @@ class BaseDataset(ABC):
         """
         pass
     
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Generate dataset rows one at a time.
+        
+        The default implementation iterates over generate(); subclasses that
+        build rows independently can override it to avoid holding every row
+        in memory.
+        
+        Returns:
+            Iterator yielding dictionaries representing dataset rows
+        """
+        return iter(self.generate())
+    
+    def generate_columns(self) -> Dict[str, List[Any]]:
+        """
+        Generate dataset as columns.
+        
+        The default implementation pivots the rows from generate(); subclasses
+        can override it to build the column lists directly.
+        
+        Returns:
+            Dictionary mapping each schema column name to a list of values
+        """
+        columns = list(self.get_schema().keys())
+        rows = self.generate()
+        
+        # Preallocate each column to the row count and fill by index
+        column_data = {col: [None] * len(rows) for col in columns}
+        targets = [(col, column_data[col]) for col in columns]
+        
+        for i, row in enumerate(rows):
+            for col, values in targets:
+                values[i] = row.get(col)
+        
+        return column_data
+    
     @abstractmethod
     def get_schema(self) -> Dict[str, str]:
         """
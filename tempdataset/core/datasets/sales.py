@@ -5,14 +5,135 @@ Generates realistic sales data with 27 columns including order information,
 customer details, product information, and financial calculations.
 """
 
+import itertools
+import operator
 import random
 import string
+import sys
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
-from .base import BaseDataset
+from .base import BaseDataset, row_factory
+from ._sales_numeric import fill_numeric
 from ..utils.faker_utils import get_faker_utils
 
+# Bound once so the column loops skip the module attribute lookup
+_choice = random.choice
+_choices = random.choices
+
+
+def _interned(values) -> tuple:
+    """Return values as a tuple of interned strings."""
+    return tuple(sys.intern(value) for value in values)
+
+
+# Categorical value pools shared by all SalesDataset instances
+REGIONS = _interned(('North', 'South', 'East', 'West', 'Central'))
+CUSTOMER_SEGMENTS = _interned(('Consumer', 'Corporate', 'Home Office'))
+ORDER_PRIORITIES = _interned(('Low', 'Medium', 'High', 'Critical'))
+SHIPPING_MODES = _interned(('Standard', 'Express', 'Overnight', 'Same Day'))
+PAYMENT_METHODS = _interned(('Credit Card', 'Debit Card', 'PayPal', 'Bank Transfer', 'Cash', 'Check'))
+SALES_REPS = _interned((
+    'John Smith', 'Sarah Johnson', 'Mike Davis', 'Lisa Wilson', 'David Brown',
+    'Jennifer Garcia', 'Robert Miller', 'Amanda Taylor', 'Chris Anderson', 'Michelle White'
+))
+GENDERS = _interned(('Male', 'Female', 'Other'))
+
+# All 17,576 three-letter product ID prefixes ("AAA" to "ZZZ")
+PRODUCT_PREFIXES = tuple(
+    ''.join(letters) for letters in itertools.product(string.ascii_uppercase, repeat=3)
+)
+
+# Subcategories per product category
+CATEGORIES = {
+    'Electronics': _interned(('Smartphones', 'Laptops', 'Tablets', 'Headphones', 'Cameras', 'Gaming')),
+    'Clothing': _interned(('Shirts', 'Pants', 'Dresses', 'Shoes', 'Accessories', 'Outerwear')),
+    'Home & Garden': _interned(('Furniture', 'Kitchen', 'Bedding', 'Decor', 'Tools', 'Appliances')),
+    'Sports': _interned(('Fitness', 'Outdoor', 'Team Sports', 'Water Sports', 'Winter Sports', 'Cycling')),
+    'Books': _interned(('Fiction', 'Non-Fiction', 'Educational', 'Children', 'Comics', 'Reference')),
+    'Health & Beauty': _interned(('Skincare', 'Makeup', 'Hair Care', 'Supplements', 'Personal Care', 'Fragrances'))
+}
+
+# Brands per product category
+BRANDS = {
+    'Electronics': _interned(('Apple', 'Samsung', 'Sony', 'LG', 'HP', 'Dell', 'Canon', 'Nintendo')),
+    'Clothing': _interned(('Nike', 'Adidas', 'Levi\'s', 'Gap', 'H&M', 'Zara', 'Under Armour', 'Puma')),
+    'Home & Garden': _interned(('IKEA', 'Home Depot', 'Lowe\'s', 'Target', 'Walmart', 'Wayfair', 'Ashley', 'KitchenAid')),
+    'Sports': _interned(('Nike', 'Adidas', 'Under Armour', 'Reebok', 'Puma', 'New Balance', 'Wilson', 'Spalding')),
+    'Books': _interned(('Penguin', 'Random House', 'HarperCollins', 'Simon & Schuster', 'Macmillan', 'Scholastic')),
+    'Health & Beauty': _interned(('L\'Oreal', 'Maybelline', 'Revlon', 'Neutrogena', 'Olay', 'Clinique', 'MAC', 'Estee Lauder'))
+}
+
+# Product names per category and subcategory
+PRODUCT_NAMES = {
+    'Electronics': {
+        'Smartphones': _interned(('iPhone Pro', 'Galaxy S Series', 'Pixel Phone', 'OnePlus Device')),
+        'Laptops': _interned(('MacBook Pro', 'ThinkPad', 'Surface Laptop', 'Gaming Laptop')),
+        'Tablets': _interned(('iPad', 'Galaxy Tab', 'Surface Pro', 'Fire Tablet')),
+        'Headphones': _interned(('AirPods', 'Wireless Headphones', 'Gaming Headset', 'Noise Cancelling')),
+        'Cameras': _interned(('DSLR Camera', 'Mirrorless Camera', 'Action Camera', 'Instant Camera')),
+        'Gaming': _interned(('Gaming Console', 'Controller', 'Gaming Mouse', 'Mechanical Keyboard'))
+    },
+    'Clothing': {
+        'Shirts': _interned(('Cotton T-Shirt', 'Dress Shirt', 'Polo Shirt', 'Hoodie')),
+        'Pants': _interned(('Jeans', 'Chinos', 'Dress Pants', 'Joggers')),
+        'Dresses': _interned(('Summer Dress', 'Evening Dress', 'Casual Dress', 'Maxi Dress')),
+        'Shoes': _interned(('Running Shoes', 'Dress Shoes', 'Sneakers', 'Boots')),
+        'Accessories': _interned(('Watch', 'Belt', 'Wallet', 'Sunglasses')),
+        'Outerwear': _interned(('Jacket', 'Coat', 'Sweater', 'Vest'))
+    },
+    'Home & Garden': {
+        'Furniture': _interned(('Sofa', 'Dining Table', 'Bed Frame', 'Office Chair')),
+        'Kitchen': _interned(('Coffee Maker', 'Blender', 'Cookware Set', 'Dinnerware')),
+        'Bedding': _interned(('Sheet Set', 'Comforter', 'Pillow', 'Mattress')),
+        'Decor': _interned(('Wall Art', 'Lamp', 'Vase', 'Mirror')),
+        'Tools': _interned(('Drill', 'Hammer', 'Screwdriver Set', 'Tool Box')),
+        'Appliances': _interned(('Microwave', 'Vacuum', 'Air Fryer', 'Dishwasher'))
+    },
+    'Sports': {
+        'Fitness': _interned(('Treadmill', 'Dumbbells', 'Yoga Mat', 'Resistance Bands')),
+        'Outdoor': _interned(('Tent', 'Sleeping Bag', 'Hiking Boots', 'Backpack')),
+        'Team Sports': _interned(('Basketball', 'Soccer Ball', 'Baseball Glove', 'Football')),
+        'Water Sports': _interned(('Swimsuit', 'Goggles', 'Life Jacket', 'Surfboard')),
+        'Winter Sports': _interned(('Ski Boots', 'Snowboard', 'Winter Jacket', 'Gloves')),
+        'Cycling': _interned(('Mountain Bike', 'Helmet', 'Bike Lock', 'Water Bottle'))
+    },
+    'Books': {
+        'Fiction': _interned(('Mystery Novel', 'Romance Novel', 'Sci-Fi Book', 'Fantasy Series')),
+        'Non-Fiction': _interned(('Biography', 'Self-Help Book', 'History Book', 'Travel Guide')),
+        'Educational': _interned(('Textbook', 'Study Guide', 'Workbook', 'Reference Manual')),
+        'Children': _interned(('Picture Book', 'Chapter Book', 'Activity Book', 'Board Book')),
+        'Comics': _interned(('Graphic Novel', 'Comic Series', 'Manga', 'Superhero Comic')),
+        'Reference': _interned(('Dictionary', 'Encyclopedia', 'Atlas', 'Cookbook'))
+    },
+    'Health & Beauty': {
+        'Skincare': _interned(('Moisturizer', 'Cleanser', 'Serum', 'Sunscreen')),
+        'Makeup': _interned(('Foundation', 'Lipstick', 'Mascara', 'Eyeshadow')),
+        'Hair Care': _interned(('Shampoo', 'Conditioner', 'Hair Styling', 'Hair Treatment')),
+        'Supplements': _interned(('Vitamins', 'Protein Powder', 'Omega-3', 'Probiotics')),
+        'Personal Care': _interned(('Toothpaste', 'Deodorant', 'Body Wash', 'Lotion')),
+        'Fragrances': _interned(('Perfume', 'Cologne', 'Body Spray', 'Essential Oil'))
+    }
+}
+
+# Category names in definition order, for drawing whole columns at once
+CATEGORY_NAMES = _interned(CATEGORIES)
+
+# Shipping and delivery delays, and customer ages, as pools for choices()
+SHIP_DELAYS = tuple(timedelta(days=days) for days in range(1, 8))
+DELIVERY_DELAYS = tuple(timedelta(days=days) for days in range(2, 15))
+CUSTOMER_AGES = range(18, 81)
+
+# Unit price range (min, max) per product category
+PRICE_RANGES = {
+    'Electronics': (50, 2000),
+    'Clothing': (15, 300),
+    'Home & Garden': (20, 1500),
+    'Sports': (25, 800),
+    'Books': (10, 50),
+    'Health & Beauty': (5, 200)
+}
+
 
 class SalesDataset(BaseDataset):
     """
@@ -47,254 +168,129 @@ class SalesDataset(BaseDataset):
     def _init_data_lists(self) -> None:
         """Initialize predefined data lists for realistic generation."""
         
-        # Product categories and subcategories
-        self.categories = {
-            'Electronics': ['Smartphones', 'Laptops', 'Tablets', 'Headphones', 'Cameras', 'Gaming'],
-            'Clothing': ['Shirts', 'Pants', 'Dresses', 'Shoes', 'Accessories', 'Outerwear'],
-            'Home & Garden': ['Furniture', 'Kitchen', 'Bedding', 'Decor', 'Tools', 'Appliances'],
-            'Sports': ['Fitness', 'Outdoor', 'Team Sports', 'Water Sports', 'Winter Sports', 'Cycling'],
-            'Books': ['Fiction', 'Non-Fiction', 'Educational', 'Children', 'Comics', 'Reference'],
-            'Health & Beauty': ['Skincare', 'Makeup', 'Hair Care', 'Supplements', 'Personal Care', 'Fragrances']
-        }
-        
-        # Brands by category
-        self.brands = {
-            'Electronics': ['Apple', 'Samsung', 'Sony', 'LG', 'HP', 'Dell', 'Canon', 'Nintendo'],
-            'Clothing': ['Nike', 'Adidas', 'Levi\'s', 'Gap', 'H&M', 'Zara', 'Under Armour', 'Puma'],
-            'Home & Garden': ['IKEA', 'Home Depot', 'Lowe\'s', 'Target', 'Walmart', 'Wayfair', 'Ashley', 'KitchenAid'],
-            'Sports': ['Nike', 'Adidas', 'Under Armour', 'Reebok', 'Puma', 'New Balance', 'Wilson', 'Spalding'],
-            'Books': ['Penguin', 'Random House', 'HarperCollins', 'Simon & Schuster', 'Macmillan', 'Scholastic'],
-            'Health & Beauty': ['L\'Oreal', 'Maybelline', 'Revlon', 'Neutrogena', 'Olay', 'Clinique', 'MAC', 'Estee Lauder']
-        }
-        
-        # Product names by category
-        self.product_names = {
-            'Electronics': {
-                'Smartphones': ['iPhone Pro', 'Galaxy S Series', 'Pixel Phone', 'OnePlus Device'],
-                'Laptops': ['MacBook Pro', 'ThinkPad', 'Surface Laptop', 'Gaming Laptop'],
-                'Tablets': ['iPad', 'Galaxy Tab', 'Surface Pro', 'Fire Tablet'],
-                'Headphones': ['AirPods', 'Wireless Headphones', 'Gaming Headset', 'Noise Cancelling'],
-                'Cameras': ['DSLR Camera', 'Mirrorless Camera', 'Action Camera', 'Instant Camera'],
-                'Gaming': ['Gaming Console', 'Controller', 'Gaming Mouse', 'Mechanical Keyboard']
-            },
-            'Clothing': {
-                'Shirts': ['Cotton T-Shirt', 'Dress Shirt', 'Polo Shirt', 'Hoodie'],
-                'Pants': ['Jeans', 'Chinos', 'Dress Pants', 'Joggers'],
-                'Dresses': ['Summer Dress', 'Evening Dress', 'Casual Dress', 'Maxi Dress'],
-                'Shoes': ['Running Shoes', 'Dress Shoes', 'Sneakers', 'Boots'],
-                'Accessories': ['Watch', 'Belt', 'Wallet', 'Sunglasses'],
-                'Outerwear': ['Jacket', 'Coat', 'Sweater', 'Vest']
-            },
-            'Home & Garden': {
-                'Furniture': ['Sofa', 'Dining Table', 'Bed Frame', 'Office Chair'],
-                'Kitchen': ['Coffee Maker', 'Blender', 'Cookware Set', 'Dinnerware'],
-                'Bedding': ['Sheet Set', 'Comforter', 'Pillow', 'Mattress'],
-                'Decor': ['Wall Art', 'Lamp', 'Vase', 'Mirror'],
-                'Tools': ['Drill', 'Hammer', 'Screwdriver Set', 'Tool Box'],
-                'Appliances': ['Microwave', 'Vacuum', 'Air Fryer', 'Dishwasher']
-            },
-            'Sports': {
-                'Fitness': ['Treadmill', 'Dumbbells', 'Yoga Mat', 'Resistance Bands'],
-                'Outdoor': ['Tent', 'Sleeping Bag', 'Hiking Boots', 'Backpack'],
-                'Team Sports': ['Basketball', 'Soccer Ball', 'Baseball Glove', 'Football'],
-                'Water Sports': ['Swimsuit', 'Goggles', 'Life Jacket', 'Surfboard'],
-                'Winter Sports': ['Ski Boots', 'Snowboard', 'Winter Jacket', 'Gloves'],
-                'Cycling': ['Mountain Bike', 'Helmet', 'Bike Lock', 'Water Bottle']
-            },
-            'Books': {
-                'Fiction': ['Mystery Novel', 'Romance Novel', 'Sci-Fi Book', 'Fantasy Series'],
-                'Non-Fiction': ['Biography', 'Self-Help Book', 'History Book', 'Travel Guide'],
-                'Educational': ['Textbook', 'Study Guide', 'Workbook', 'Reference Manual'],
-                'Children': ['Picture Book', 'Chapter Book', 'Activity Book', 'Board Book'],
-                'Comics': ['Graphic Novel', 'Comic Series', 'Manga', 'Superhero Comic'],
-                'Reference': ['Dictionary', 'Encyclopedia', 'Atlas', 'Cookbook']
-            },
-            'Health & Beauty': {
-                'Skincare': ['Moisturizer', 'Cleanser', 'Serum', 'Sunscreen'],
-                'Makeup': ['Foundation', 'Lipstick', 'Mascara', 'Eyeshadow'],
-                'Hair Care': ['Shampoo', 'Conditioner', 'Hair Styling', 'Hair Treatment'],
-                'Supplements': ['Vitamins', 'Protein Powder', 'Omega-3', 'Probiotics'],
-                'Personal Care': ['Toothpaste', 'Deodorant', 'Body Wash', 'Lotion'],
-                'Fragrances': ['Perfume', 'Cologne', 'Body Spray', 'Essential Oil']
-            }
-        }
-        
-        # Geographic data
-        self.regions = ['North', 'South', 'East', 'West', 'Central']
-        
-        # Customer segments
-        self.customer_segments = ['Consumer', 'Corporate', 'Home Office']
-        
-        # Order priorities
-        self.order_priorities = ['Low', 'Medium', 'High', 'Critical']
+        # Categorical pools are shared module-level interned tuples
+        self.categories = CATEGORIES
+        self.brands = BRANDS
+        self.product_names = PRODUCT_NAMES
+        self.regions = REGIONS
+        self.customer_segments = CUSTOMER_SEGMENTS
+        self.order_priorities = ORDER_PRIORITIES
+        self.shipping_modes = SHIPPING_MODES
+        self.payment_methods = PAYMENT_METHODS
+        self.sales_reps = SALES_REPS
+        self.genders = GENDERS
+    
+    def generate(self) -> List[Dict[str, Any]]:
+        """
+        Generate sales dataset rows.
         
-        # Shipping modes
-        self.shipping_modes = ['Standard', 'Express', 'Overnight', 'Same Day']
+        Builds the columns with generate_columns() and only zips them into
+        row dictionaries at the end.
         
-        # Payment methods
-        self.payment_methods = ['Credit Card', 'Debit Card', 'PayPal', 'Bank Transfer', 'Cash', 'Check']
+        Returns:
+            List of dictionaries representing sales transaction rows
+        """
+        return list(self.iter_rows())
+    
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Generate sales dataset rows one at a time.
         
-        # Sales representatives
-        self.sales_reps = [
-            'John Smith', 'Sarah Johnson', 'Mike Davis', 'Lisa Wilson', 'David Brown',
-            'Jennifer Garcia', 'Robert Miller', 'Amanda Taylor', 'Chris Anderson', 'Michelle White'
-        ]
+        Rows are zipped lazily from generate_columns(), so a seeded dataset
+        yields the same rows as generate() and only the column lists are
+        held in memory.
         
-        # Gender options
-        self.genders = ['Male', 'Female', 'Other']
+        Returns:
+            Iterator yielding dictionaries representing sales transaction rows
+        """
+        column_data = self.generate_columns()
+        make_row = row_factory(tuple(column_data))
+        yield from itertools.starmap(make_row, zip(*column_data.values()))
     
-    def generate(self) -> List[Dict[str, Any]]:
+    def generate_columns(self) -> Dict[str, List[Any]]:
         """
-        Generate sales dataset rows.
+        Generate sales dataset as columns.
+        
+        Builds each column in its own pass; the pricing columns are filled
+        in bulk by fill_numeric().
         
         Returns:
-            List of dictionaries representing sales transaction rows
+            Dictionary mapping each schema column name to a list of values
         """
         if self.seed is not None:
             random.seed(self.seed)
             self.faker_utils.set_seed(self.seed)
         
-        data = []
+        n = self.rows
+        faker_utils = self.faker_utils
         
-        for i in range(self.rows):
-            row = self._generate_row()
-            data.append(row)
-        
-        return data
-    
-    def _generate_row(self) -> Dict[str, Any]:
-        """Generate a single sales transaction row."""
-        
-        # Generate order date (within last 2 years)
+        # Order dates (within last 2 years) and dependent shipping dates
         end_date = datetime.now()
         start_date = end_date - timedelta(days=730)
-        order_date = self.faker_utils.date_between(start_date, end_date)
-        
-        # Generate customer information
-        customer_name = self.faker_utils.name()
-        customer_email = self.faker_utils.email(customer_name)
+        order_dates = [faker_utils.date_between(start_date, end_date) for _ in range(n)]
+        ship_dates = list(map(operator.add, order_dates, _choices(SHIP_DELAYS, k=n)))
+        delivery_dates = list(map(operator.add, ship_dates, _choices(DELIVERY_DELAYS, k=n)))
         
-        # Generate product information
-        category = random.choice(list(self.categories.keys()))
-        subcategory = random.choice(self.categories[category])
-        brand = random.choice(self.brands[category])
-        product_name = random.choice(self.product_names[category][subcategory])
+        # Customer information
+        customer_names = [faker_utils.name() for _ in range(n)]
+        customer_emails = [faker_utils.email(name) for name in customer_names]
         
-        # Generate quantities and pricing
-        quantity = random.randint(1, 10)
-        unit_price = self._generate_unit_price(category)
-        total_price = quantity * unit_price
-        discount = round(total_price * random.uniform(0, 0.20), 2)  # 0-20% discount
-        final_price = total_price - discount
-        profit = round(final_price * random.uniform(0.10, 0.30), 2)  # 10-30% profit
-        
-        # Generate dates with proper relationships
-        ship_date = order_date + timedelta(days=random.randint(1, 7))
-        delivery_date = ship_date + timedelta(days=random.randint(2, 14))
+        # Product information
+        categories = _choices(CATEGORY_NAMES, k=n)
+        subcategories = [_choice(CATEGORIES[c]) for c in categories]
+        brands = [_choice(BRANDS[c]) for c in categories]
+        product_names = [
+            _choice(PRODUCT_NAMES[c][sub]) for c, sub in zip(categories, subcategories)
+        ]
         
-        # Generate geographic information
-        region = random.choice(self.regions)
-        country = self.faker_utils.country()
-        state = self.faker_utils.state()
-        city = self.faker_utils.city()
-        postal_code = self.faker_utils.postal_code()
+        # Quantities and pricing
+        numeric = fill_numeric(categories, PRICE_RANGES)
         
-        # Generate customer demographics
-        customer_age = random.randint(18, 80)
-        customer_gender = random.choice(self.genders)
+        # Sequential IDs are formatted from the counter range in one pass
+        order_start = self._order_counter
+        customer_start = self._customer_counter
+        self._order_counter += n
+        self._customer_counter += n
         
         return {
-            'order_id': self._generate_order_id(order_date),
-            'customer_id': self._generate_customer_id(),
-            'customer_name': customer_name,
-            'customer_email': customer_email,
-            'product_id': self._generate_product_id(),
-            'product_name': product_name,
-            'category': category,
-            'subcategory': subcategory,
-            'brand': brand,
-            'quantity': quantity,
-            'unit_price': round(unit_price, 2),
-            'total_price': round(total_price, 2),
-            'discount': discount,
-            'final_price': round(final_price, 2),
-            'order_date': order_date.strftime('%Y-%m-%d'),
-            'ship_date': ship_date.strftime('%Y-%m-%d'),
-            'delivery_date': delivery_date.strftime('%Y-%m-%d'),
-            'sales_rep': random.choice(self.sales_reps),
-            'region': region,
-            'country': country,
-            'state/province': state,
-            'city': city,
-            'postal_code': postal_code,
-            'customer_segment': random.choice(self.customer_segments),
-            'order_priority': random.choice(self.order_priorities),
-            'shipping_mode': random.choice(self.shipping_modes),
-            'payment_method': random.choice(self.payment_methods),
-            'customer_age': customer_age,
-            'customer_gender': customer_gender,
-            'profit': profit
+            'order_id': [
+                'ORD-%d-%06d' % (d.year, seq)
+                for d, seq in zip(order_dates, range(order_start, order_start + n))
+            ],
+            'customer_id': ['CUST-%04d' % seq for seq in range(customer_start, customer_start + n)],
+            'customer_name': customer_names,
+            'customer_email': customer_emails,
+            'product_id': [
+                'PROD-%s%03d' % pair
+                for pair in zip(_choices(PRODUCT_PREFIXES, k=n), _choices(range(1000), k=n))
+            ],
+            'product_name': product_names,
+            'category': categories,
+            'subcategory': subcategories,
+            'brand': brands,
+            'quantity': numeric['quantity'],
+            'unit_price': numeric['unit_price'],
+            'total_price': numeric['total_price'],
+            'discount': numeric['discount'],
+            'final_price': numeric['final_price'],
+            'order_date': [d.strftime('%Y-%m-%d') for d in order_dates],
+            'ship_date': [d.strftime('%Y-%m-%d') for d in ship_dates],
+            'delivery_date': [d.strftime('%Y-%m-%d') for d in delivery_dates],
+            'sales_rep': _choices(SALES_REPS, k=n),
+            'region': _choices(REGIONS, k=n),
+            'country': [faker_utils.country() for _ in range(n)],
+            'state/province': [faker_utils.state() for _ in range(n)],
+            'city': [faker_utils.city() for _ in range(n)],
+            'postal_code': [faker_utils.postal_code() for _ in range(n)],
+            'customer_segment': _choices(CUSTOMER_SEGMENTS, k=n),
+            'order_priority': _choices(ORDER_PRIORITIES, k=n),
+            'shipping_mode': _choices(SHIPPING_MODES, k=n),
+            'payment_method': _choices(PAYMENT_METHODS, k=n),
+            'customer_age': _choices(CUSTOMER_AGES, k=n),
+            'customer_gender': _choices(GENDERS, k=n),
+            'profit': numeric['profit']
         }
     
-    def _generate_order_id(self, order_date: datetime) -> str:
-        """
-        Generate order ID in format "ORD-YYYY-NNNNNN".
-        
-        Args:
-            order_date: Date of the order
-            
-        Returns:
-            Formatted order ID
-        """
-        year = order_date.year
-        order_num = str(self._order_counter).zfill(6)
-        self._order_counter += 1
-        return f"ORD-{year}-{order_num}"
-    
-    def _generate_customer_id(self) -> str:
-        """
-        Generate customer ID in format "CUST-NNNN".
-        
-        Returns:
-            Formatted customer ID
-        """
-        customer_num = str(self._customer_counter).zfill(4)
-        self._customer_counter += 1
-        return f"CUST-{customer_num}"
-    
-    def _generate_product_id(self) -> str:
-        """
-        Generate product ID in format "PROD-AAANNN".
-        
-        Returns:
-            Formatted product ID
-        """
-        letters = ''.join(random.choices(string.ascii_uppercase, k=3))
-        numbers = ''.join(random.choices(string.digits, k=3))
-        return f"PROD-{letters}{numbers}"
-    
-    def _generate_unit_price(self, category: str) -> float:
-        """
-        Generate realistic unit price based on category.
-        
-        Args:
-            category: Product category
-            
-        Returns:
-            Unit price as float
-        """
-        price_ranges = {
-            'Electronics': (50, 2000),
-            'Clothing': (15, 300),
-            'Home & Garden': (20, 1500),
-            'Sports': (25, 800),
-            'Books': (10, 50),
-            'Health & Beauty': (5, 200)
-        }
-        
-        min_price, max_price = price_ranges.get(category, (10, 100))
-        return random.uniform(min_price, max_price)
-    
     def get_schema(self) -> Dict[str, str]:
         """
         Return column schema with types.
@@ -19,7 +19,8 @@ class DatasetNotFoundError(TempDatasetError):
         message = (
             f"Dataset type '{dataset_type}' not found. "
             f"Available types: {available_types}. "
-            f"Suggestion: Check spelling or register a custom dataset."
+            f"Suggestion: Check spelling. The built-in registry is read-only; "
+            f"register custom datasets on your own DataGenerator instance."
         )
         super().__init__(message)
 
@@ -146,6 +147,31 @@ class JSONWriteError(FileOperationError):
         super().__init__(message, filename)
 
 
+class ParquetWriteError(FileOperationError):
+    """Raised when Parquet file writing fails."""
+    
+    def __init__(self, filename: str, original_error: Exception = None):
+        self.original_error = original_error
+        
+        message = f"Failed to write Parquet file: {filename}. "
+        
+        if original_error:
+            if isinstance(original_error, ImportError):
+                message += "The pyarrow library is required for Parquet output. Install it with: pip install tempdataset[parquet]."
+            elif "Permission denied" in str(original_error):
+                message += "Permission denied. Please check directory permissions."
+            elif "No space left" in str(original_error):
+                message += "Insufficient disk space."
+            elif "No such file or directory" in str(original_error):
+                message += "Directory does not exist."
+            else:
+                message += f"Error details: {str(original_error)}"
+        
+        message += " Suggestion: Ensure pyarrow is installed and you have write permissions."
+        
+        super().__init__(message, filename)
+
+
 class ValidationError(TempDatasetError):
     """Raised when input validation fails."""
     
@@ -5,19 +5,64 @@ Coordinates dataset generation and manages the dataset registry.
 """
 
 import os
+import random
 import warnings
-from typing import Dict, Type, Union, Optional, Iterator, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Union, Optional, Iterator, List, Any
 from .datasets.base import BaseDataset
 from .utils.data_frame import TempDataFrame
+from .io.csv_handler import read_csv, write_csv_streaming
+from .io.json_handler import read_json, write_json_streaming
 from .utils.performance import (
     MemoryMonitor, ProgressTracker, BatchProcessor, 
-    DataStructureOptimizer, optimize_for_large_datasets, PerformanceProfiler
+    optimize_for_large_datasets, PerformanceProfiler
 )
 from .exceptions import (
-    DatasetNotFoundError, DataGenerationError, ValidationError,
+    TempDatasetError, DatasetNotFoundError, DataGenerationError, ValidationError,
     MemoryError as TempDatasetMemoryError, DependencyWarning, PerformanceWarning
 )
 
+# Writers that stream generated rows to a file, keyed by extension
+_ROW_WRITERS = {
+    '.csv': write_csv_streaming,
+    '.json': lambda rows, filename, columns: write_json_streaming(rows, filename, lines=False),
+}
+
+# TempDataFrame methods for columnar formats written from column buffers
+_FRAME_WRITERS = {
+    '.parquet': 'to_parquet',
+}
+
+# Readers used to load back files written by the streaming path
+_FILE_READERS = {
+    '.csv': read_csv,
+    '.json': read_json,
+}
+
+# Extensions that make generate() write to a file instead of memory
+_FILE_EXTENSIONS = tuple(_ROW_WRITERS) + tuple(_FRAME_WRITERS)
+
+# Dataset generated when a filename does not name a registered dataset
+_DEFAULT_FILE_DATASET = 'sales'
+
+
+@lru_cache(maxsize=None)
+def _faker_available() -> bool:
+    """
+    Check if Faker library is available.
+    
+    The result is cached so the import probe runs once per process.
+    
+    Returns:
+        True if Faker is available, False otherwise
+    """
+    try:
+        import faker
+        return True
+    except ImportError:
+        return False
+
 
 class DataGenerator:
     """
@@ -26,10 +71,19 @@ class DataGenerator:
     Manages dataset registration and provides the main generation interface.
     """
     
-    def __init__(self):
-        """Initialize the data generator with empty registry."""
-        self.datasets: Dict[str, Type[BaseDataset]] = {}
-        self.faker_available = self._check_faker()
+    __slots__ = ('datasets', 'faker_available', 'memory_monitor', 'profiler', 'seed')
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the data generator with empty registry.
+        
+        Args:
+            seed: Optional random seed; when set, every dataset instance the
+                generator creates is seeded from it for reproducible output
+        """
+        self.datasets: Mapping[str, Type[BaseDataset]] = {}
+        self.seed = seed
+        self.faker_available = _faker_available()
         self.memory_monitor = MemoryMonitor()
         self.profiler = PerformanceProfiler()
     
@@ -43,7 +97,14 @@ class DataGenerator:
             
         Raises:
             ValidationError: If parameters are invalid
+            TempDatasetError: If the registry has been frozen
         """
+        if isinstance(self.datasets, MappingProxyType):
+            raise TempDatasetError(
+                f"Cannot register dataset '{name}': the dataset registry is frozen. "
+                f"Register datasets before calling freeze()."
+            )
+        
         # Validate input parameters
         if not isinstance(name, str):
             raise ValidationError("name", name, "string")
@@ -65,16 +126,50 @@ class DataGenerator:
         
         self.datasets[name] = dataset_class
     
-    def generate(self, dataset_type: str, rows: int = 500) -> TempDataFrame:
+    def freeze(self) -> None:
+        """
+        Make the dataset registry read-only.
+        
+        Called once all built-in datasets are registered; later calls to
+        register_dataset() raise TempDatasetError.
+        """
+        if not isinstance(self.datasets, MappingProxyType):
+            self.datasets = MappingProxyType(self.datasets)
+    
+    def get_schema(self, dataset_type: str) -> Dict[str, str]:
+        """
+        Get the column schema of a dataset type.
+        
+        Args:
+            dataset_type: Dataset type ('sales') or output filename ('sales.csv')
+            
+        Returns:
+            Dictionary mapping column names to their data types
+            
+        Raises:
+            DatasetNotFoundError: If dataset_type names no registered dataset
+        """
+        if dataset_type.endswith(_FILE_EXTENSIONS):
+            dataset_type = self._dataset_type_from_filename(os.path.splitext(dataset_type)[0])
+        
+        if dataset_type not in self.datasets:
+            raise DatasetNotFoundError(dataset_type, list(self.datasets.keys()))
+        
+        return self.datasets[dataset_type](1).get_schema()
+    
+    def generate(self, dataset_type: str, rows: int = 500, stream: bool = False) -> Optional[TempDataFrame]:
         """
         Generate dataset using registered generators.
         
         Args:
             dataset_type: Dataset type ('sales', 'customers') or filename ('sales.csv', 'customers.json')
             rows: Number of rows to generate
+            stream: If True and dataset_type is a filename, write rows straight
+                to the file without building a TempDataFrame
             
         Returns:
-            TempDataFrame containing the generated data (also saves to file if filename provided)
+            TempDataFrame containing the generated data (also saves to file if filename provided),
+            or None when streaming to a file
             
         Raises:
             ValidationError: If parameters are invalid
@@ -82,28 +177,29 @@ class DataGenerator:
             DataGenerationError: If data generation fails
             TempDatasetMemoryError: If memory limits are exceeded
         """
-        # Validate input parameters
-        if not isinstance(dataset_type, str):
-            raise ValidationError("dataset_type", dataset_type, "string")
-        
-        if not dataset_type.strip():
-            raise ValidationError("dataset_type", dataset_type, "non-empty string")
-        
-        if not isinstance(rows, int):
-            raise ValidationError("rows", rows, "integer")
+        # Validate input parameters; the string check is folded into the
+        # file extension test, which only strings support
+        try:
+            is_file = dataset_type.endswith(_FILE_EXTENSIONS)
+        except (AttributeError, TypeError):
+            raise ValidationError("dataset_type", dataset_type, "string") from None
         
-        if rows < 0:
+        if not isinstance(rows, int) or rows < 0:
+            if not isinstance(rows, int):
+                raise ValidationError("rows", rows, "integer")
             raise ValidationError("rows", rows, "non-negative integer")
         
         # Check memory requirements for large datasets
         self._check_memory_requirements(rows)
         
         # Check if it's a file output request
-        if dataset_type.endswith('.csv') or dataset_type.endswith('.json'):
-            return self._generate_to_file(dataset_type, rows)
+        if is_file:
+            return self._generate_to_file(dataset_type, rows, stream)
         
         # Generate dataset in memory
         if dataset_type not in self.datasets:
+            if not dataset_type.strip():
+                raise ValidationError("dataset_type", dataset_type, "non-empty string")
             available = list(self.datasets.keys())
             raise DatasetNotFoundError(dataset_type, available)
         
@@ -133,7 +229,7 @@ class DataGenerator:
             schema = temp_dataset.get_schema()
             columns = list(schema.keys())
             
-            return TempDataFrame(data, columns)
+            return TempDataFrame.from_columns(data, columns)
             
         except Exception as e:
             # Wrap any unexpected errors in DataGenerationError
@@ -146,16 +242,17 @@ class DataGenerator:
                 rows
             ) from e
     
-    def _generate_to_file(self, filename: str, rows: int) -> TempDataFrame:
+    def _generate_to_file(self, filename: str, rows: int, stream: bool = False) -> Optional[TempDataFrame]:
         """
         Generate dataset and save to file.
         
         Args:
             filename: Output filename with extension
             rows: Number of rows to generate
+            stream: If True, only write the file and skip building the frame
             
         Returns:
-            TempDataFrame containing the generated data
+            TempDataFrame containing the generated data, or None if stream is True
             
         Raises:
             ValidationError: If filename format is invalid
@@ -166,11 +263,11 @@ class DataGenerator:
             raise ValidationError("filename", filename, "non-empty string")
         
         # Extract dataset type from filename
-        base_name = os.path.splitext(filename)[0]
-        extension = os.path.splitext(filename)[1].lower()
+        base_name, extension = os.path.splitext(filename)
+        extension = extension.lower()
         
         # Validate file extension
-        supported_extensions = ['.csv', '.json']
+        supported_extensions = list(_FILE_EXTENSIONS)
         if extension not in supported_extensions:
             raise ValidationError(
                 "filename", 
@@ -190,77 +287,73 @@ class DataGenerator:
                     rows=rows
                 ) from e
         
-        # Determine dataset type from filename
-        # Try to extract dataset type from filename base
-        dataset_type = None
-        
-        # First, try exact match with base filename
-        if base_name.lower() in self.datasets:
-            dataset_type = base_name.lower()
-        else:
-            # Try to find registered dataset types within the filename
-            for registered_type in self.datasets.keys():
-                if registered_type in base_name.lower():
-                    dataset_type = registered_type
-                    break
-            
-            # If still not found, default to sales for backward compatibility
-            if dataset_type is None:
-                dataset_type = 'sales'
+        dataset_type = self._dataset_type_from_filename(base_name)
         
         try:
             # Get optimization settings
             optimization_settings = optimize_for_large_datasets(rows)
             
             # Use streaming for very large datasets to avoid memory issues
-            if optimization_settings["use_streaming"]:
+            if optimization_settings["use_streaming"] and extension in _FILE_READERS:
                 self._generate_streaming_to_file(dataset_type, rows, filename)
+                if stream:
+                    return None
                 # For streaming, we need to read the file back to return a DataFrame
                 # This is not ideal for very large files, but maintains API consistency
-                if extension == '.csv':
-                    from .io.csv_handler import read_csv
-                    return read_csv(filename)
-                elif extension == '.json':
-                    from .io.json_handler import read_json
-                    return read_json(filename)
-            else:
-                # Generate the data in memory first by calling the core generation logic directly
-                if dataset_type not in self.datasets:
-                    available = list(self.datasets.keys())
-                    raise DatasetNotFoundError(dataset_type, available)
+                return _FILE_READERS[extension](filename)
+            
+            if dataset_type not in self.datasets:
+                available = list(self.datasets.keys())
+                raise DatasetNotFoundError(dataset_type, available)
+            
+            # Get schema from dataset class
+            dataset_class = self.datasets[dataset_type]
+            temp_dataset = dataset_class(1)  # Create temporary instance for schema
+            schema = temp_dataset.get_schema()
+            columns = list(schema.keys())
+            
+            # Start performance profiling
+            self.profiler.start_operation("data_generation")
+            
+            row_writer = _ROW_WRITERS.get(extension)
+            if row_writer is not None and stream:
+                # File-only callers get rows piped straight into the writer
+                row_writer(self._iter_rows(dataset_type, rows, optimization_settings), filename, columns)
+                temp_df = None
+            elif row_writer is not None:
+                # Collect column buffers for the returned frame while rows are
+                # streamed to the file, so no intermediate row list is built
+                data = {col: [None] * rows for col in columns}
+                targets = [(col, data[col]) for col in columns]
                 
-                # Start performance profiling
-                self.profiler.start_operation("data_generation")
+                def collecting_rows() -> Iterator[Dict[str, Any]]:
+                    for i, row in enumerate(self._iter_rows(dataset_type, rows, optimization_settings)):
+                        for col, values in targets:
+                            values[i] = row.get(col)
+                        yield row
                 
-                # Use optimized generation for large datasets
+                row_writer(collecting_rows(), filename, columns)
+                temp_df = TempDataFrame.from_columns(data, columns)
+            else:
+                # Columnar formats are written from the finished column buffers
                 if optimization_settings["use_batching"]:
                     data = self._generate_with_batching(dataset_type, rows, optimization_settings)
                 else:
                     data = self._generate_standard(dataset_type, rows, optimization_settings)
                 
-                # End performance profiling
-                generation_time = self.profiler.end_operation("data_generation")
-                
-                # Log performance info for large datasets
-                if optimization_settings["show_progress"]:
-                    print(f"\nGeneration completed in {generation_time:.2f}s ({rows/generation_time:.0f} rows/sec)")
-                
-                # Get schema from dataset class
-                dataset_class = self.datasets[dataset_type]
-                temp_dataset = dataset_class(1)  # Create temporary instance for schema
-                schema = temp_dataset.get_schema()
-                columns = list(schema.keys())
-                
-                # Create TempDataFrame
-                temp_df = TempDataFrame(data, columns)
-                
-                # Save to appropriate format
-                if extension == '.csv':
-                    temp_df.to_csv(filename)
-                elif extension == '.json':
-                    temp_df.to_json(filename)
-                
-                return temp_df
+                temp_df = TempDataFrame.from_columns(data, columns)
+                getattr(temp_df, _FRAME_WRITERS[extension])(filename)
+                if stream:
+                    temp_df = None
+            
+            # End performance profiling
+            generation_time = self.profiler.end_operation("data_generation")
+            
+            # Log performance info for large datasets
+            if optimization_settings["show_progress"]:
+                print(f"\nGeneration completed in {generation_time:.2f}s ({rows/generation_time:.0f} rows/sec)")
+            
+            return temp_df
                 
         except Exception as e:
             if isinstance(e, (ValidationError, DatasetNotFoundError, TempDatasetMemoryError)):
@@ -272,6 +365,31 @@ class DataGenerator:
                 rows
             ) from e
     
+    def _dataset_type_from_filename(self, base_name: str) -> str:
+        """
+        Determine the dataset type to generate from an output filename.
+        
+        Args:
+            base_name: Filename without its extension
+            
+        Returns:
+            Registered dataset type named in the filename, or the default
+            file dataset type if none matches
+        """
+        base_name = base_name.lower()
+        
+        # First, try exact match with base filename
+        if base_name in self.datasets:
+            return base_name
+        
+        # Try to find registered dataset types within the filename
+        for registered_type in self.datasets:
+            if registered_type in base_name:
+                return registered_type
+        
+        # Fall back to the default for backward compatibility
+        return _DEFAULT_FILE_DATASET
+    
     def _check_memory_requirements(self, rows: int) -> None:
         """
         Check if the requested number of rows might exceed memory limits.
@@ -300,7 +418,50 @@ class DataGenerator:
                 stacklevel=3
             )
     
-    def _generate_standard(self, dataset_type: str, rows: int, optimization_settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _create_dataset(self, dataset_class: Type[BaseDataset], rows: int, batch_index: int = 0) -> BaseDataset:
+        """
+        Create a dataset instance, seeding it when the generator has a seed.
+        
+        Each batch gets its own seed derived from the generator seed, so
+        batches are reproducible independently of each other and of the
+        order they are generated in.
+        
+        Args:
+            dataset_class: Registered dataset class
+            rows: Number of rows the instance should generate
+            batch_index: Index of the batch the instance generates
+            
+        Returns:
+            Dataset instance ready to generate
+        """
+        dataset = dataset_class(rows)
+        rows_seed = self._rows_seed(batch_index)
+        if rows_seed is not None:
+            dataset.set_seed(rows_seed)
+        return dataset
+    
+    def _rows_seed(self, batch_index: int) -> Optional[int]:
+        """
+        Get the seed for a batch of rows.
+        
+        The first batch uses the generator seed itself, so unbatched output
+        matches a dataset seeded directly. Later batches hash the seed and
+        batch index together, so batches of neighbouring generator seeds
+        never share a seed.
+        
+        Args:
+            batch_index: Index of the batch
+            
+        Returns:
+            Seed for the batch, or None if the generator is unseeded
+        """
+        if self.seed is None:
+            return None
+        if batch_index == 0:
+            return self.seed
+        return random.Random(f"{self.seed}:{batch_index}").getrandbits(64)
+    
+    def _generate_standard(self, dataset_type: str, rows: int, optimization_settings: Dict[str, Any]) -> Dict[str, List[Any]]:
         """
         Generate dataset using standard method.
         
@@ -310,25 +471,18 @@ class DataGenerator:
             optimization_settings: Optimization settings
             
         Returns:
-            List of dictionaries representing the data
+            Dictionary mapping column names to lists of values
         """
-        dataset_class = self.datasets[dataset_type]
-        dataset = dataset_class(rows)
+        dataset = self._create_dataset(self.datasets[dataset_type], rows)
         
         # Monitor memory usage if enabled
         if optimization_settings["memory_monitoring"]:
             self.memory_monitor.check_memory_usage("standard generation")
         
         # Generate data
-        data = dataset.generate()
-        
-        # Optimize data structure if needed
-        if rows > 5000:
-            data = DataStructureOptimizer.optimize_dict_list(data)
-        
-        return data
+        return dataset.generate_columns()
     
-    def _generate_with_batching(self, dataset_type: str, rows: int, optimization_settings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_with_batching(self, dataset_type: str, rows: int, optimization_settings: Dict[str, Any]) -> Dict[str, List[Any]]:
         """
         Generate dataset using batch processing for memory efficiency.
         
@@ -338,33 +492,76 @@ class DataGenerator:
             optimization_settings: Optimization settings
             
         Returns:
-            List of dictionaries representing the data
+            Dictionary mapping column names to lists of values
         """
         batch_size = optimization_settings["batch_size"]
-        batch_processor = BatchProcessor(batch_size)
+        dataset_class = self.datasets[dataset_type]
+        progress = ProgressTracker(rows, f"Generating {dataset_type} data")
         
-        def batch_generator(start_idx: int, batch_size: int) -> Iterator[Dict[str, Any]]:
-            """Generate a batch of data."""
-            dataset_class = self.datasets[dataset_type]
-            dataset = dataset_class(batch_size)
-            batch_data = dataset.generate()
-            return iter(batch_data)
+        # Preallocate the full columns and copy each batch into its slice
+        columns = list(dataset_class(1).get_schema().keys())
+        all_data: Dict[str, List[Any]] = {col: [None] * rows for col in columns}
         
-        # Process in batches and collect results
-        all_data = []
-        progress_desc = f"Generating {dataset_type} data"
+        try:
+            for start_idx in range(0, rows, batch_size):
+                # Calculate actual batch size (handle last batch)
+                actual_batch_size = min(batch_size, rows - start_idx)
+                
+                # Check memory before processing batch
+                self.memory_monitor.check_memory_usage(f"batch {start_idx//batch_size + 1}")
+                
+                batch_data = self._create_dataset(
+                    dataset_class, actual_batch_size, start_idx // batch_size
+                ).generate_columns()
+                end_idx = start_idx + actual_batch_size
+                for col, values in all_data.items():
+                    values[start_idx:end_idx] = batch_data[col]
+                
+                progress.update(actual_batch_size)
+        finally:
+            progress.finish()
         
-        for item in batch_processor.process_in_batches(
-            rows, 
-            batch_generator, 
-            progress_description=progress_desc
-        ):
-            all_data.append(item)
+        return all_data
+    
+    def _iter_rows(self, dataset_type: str, rows: int, optimization_settings: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Generate dataset rows one at a time.
         
-        # Optimize final data structure
-        all_data = DataStructureOptimizer.optimize_dict_list(all_data)
+        Args:
+            dataset_type: Type of dataset to generate
+            rows: Number of rows to generate
+            optimization_settings: Optimization settings
+            
+        Yields:
+            Dictionary representing a row of data
+        """
+        dataset_class = self.datasets[dataset_type]
         
-        return all_data
+        if not optimization_settings["use_batching"]:
+            # Monitor memory usage if enabled
+            if optimization_settings["memory_monitoring"]:
+                self.memory_monitor.check_memory_usage("standard generation")
+            
+            yield from self._create_dataset(dataset_class, rows).iter_rows()
+            return
+        
+        batch_size = optimization_settings["batch_size"]
+        progress = ProgressTracker(rows, f"Generating {dataset_type} data")
+        
+        try:
+            for start_idx in range(0, rows, batch_size):
+                # Calculate actual batch size (handle last batch)
+                actual_batch_size = min(batch_size, rows - start_idx)
+                
+                # Check memory before processing batch
+                self.memory_monitor.check_memory_usage(f"batch {start_idx//batch_size + 1}")
+                
+                yield from self._create_dataset(
+                    dataset_class, actual_batch_size, start_idx // batch_size
+                ).iter_rows()
+                progress.update(actual_batch_size)
+        finally:
+            progress.finish()
     
     def _generate_streaming_to_file(self, dataset_type: str, rows: int, filename: str) -> None:
         """
@@ -389,14 +586,13 @@ class DataGenerator:
         
         def batch_generator(start_idx: int, batch_size: int) -> Iterator[Dict[str, Any]]:
             """Generate a batch of data."""
-            dataset = dataset_class(batch_size)
+            batch_index = start_idx // optimization_settings["batch_size"]
+            dataset = self._create_dataset(dataset_class, batch_size, batch_index)
             batch_data = dataset.generate()
             return iter(batch_data)
         
         # Stream directly to file
         if extension == '.csv':
-            from .io.csv_handler import write_csv_streaming
-            
             def data_generator():
                 batch_processor = BatchProcessor(batch_size)
                 for item in batch_processor.process_in_batches(
@@ -409,8 +605,6 @@ class DataGenerator:
             write_csv_streaming(data_generator(), filename, columns)
             
         elif extension == '.json':
-            from .io.json_handler import write_json_streaming
-            
             def data_generator():
                 batch_processor = BatchProcessor(batch_size)
                 for item in batch_processor.process_in_batches(
@@ -435,19 +629,6 @@ class DataGenerator:
             "current_memory_mb": self.memory_monitor.current_memory
         }
     
-    def _check_faker(self) -> bool:
-        """
-        Check if Faker library is available.
-        
-        Returns:
-            True if Faker is available, False otherwise
-        """
-        try:
-            import faker
-            return True
-        except ImportError:
-            return False
-    
     def _warn_faker_missing(self) -> None:
         """
         Show warning about missing Faker library when actually needed.
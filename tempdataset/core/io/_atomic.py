@@ -0,0 +1,51 @@
+"""
+Atomic file replacement for the CSV and JSON writers.
+
+Output is written to a temporary file next to the target and moved into
+place only once it is complete, so readers never see a partially written
+file.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Any, Iterator
+
+# mkstemp() creates files readable only by their owner; finished files get
+# the permissions open() would have given them under the process umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_open(filename: str, mode: str, **kwargs: Any) -> Iterator[IO]:
+    """
+    Open a temporary file that replaces filename when the block succeeds.
+
+    The temporary file gets a unique name in the same directory, so
+    concurrent writers never share it and the final os.replace() is a
+    rename on one filesystem. If the block raises, the temporary file is
+    removed and the target is left untouched.
+
+    Args:
+        filename: Path of the file to write
+        mode: Write mode passed to open(), e.g. 'w' or 'wb'
+        **kwargs: Further arguments for open()
+
+    Yields:
+        File object for the temporary file
+    """
+    directory, base_name = os.path.split(filename)
+    fd, temp_name = tempfile.mkstemp(dir=directory or '.', prefix=f'.{base_name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.chmod(temp_name, _FILE_MODE)
+        os.replace(temp_name, filename)
+    except BaseException:
+        try:
+            os.remove(temp_name)
+        except OSError:
+            pass
+        raise
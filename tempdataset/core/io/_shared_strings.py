@@ -0,0 +1,38 @@
+"""
+String sharing for columns read from CSV and JSON files.
+
+Parsers create a new string object for every cell, even when a column only
+holds a handful of distinct values. Sharing equal values keeps one object
+per distinct value.
+"""
+
+from typing import Any, Dict, List
+
+# Values sampled per column to decide whether equal strings are shared
+_SHARE_SAMPLE_SIZE = 1024
+
+
+def share_repeated_strings(column_data: Dict[str, List[Any]]) -> None:
+    """
+    Make equal string values in low-cardinality columns share one object.
+    
+    The parser creates a new string for every occurrence of a repeated
+    value (categories, statuses, ...). Columns whose sampled values are
+    mostly repeats are passed through a dict so each distinct value is
+    stored once. High-cardinality columns are left alone.
+    
+    Args:
+        column_data: Dictionary of column lists, updated in place
+    """
+    for values in column_data.values():
+        sample = values[:_SHARE_SAMPLE_SIZE]
+        if not sample or type(sample[0]) is not str:
+            continue
+        
+        try:
+            if len(set(sample)) > len(sample) // 4:
+                continue
+            cache: Dict[Any, Any] = {}
+            values[:] = map(cache.setdefault, values, values)
+        except TypeError:
+            continue  # Column holds unhashable values (lists, objects)
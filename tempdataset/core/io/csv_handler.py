@@ -6,19 +6,45 @@ Handles reading and writing CSV files for the TempDataset library.
 
 import csv
 import os
-from typing import List, Dict, Any, Optional, Iterator
-from pathlib import Path
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Iterator, Type, Callable, Tuple
+from ._atomic import atomic_open
+from ._shared_strings import share_repeated_strings
 from ..utils.data_frame import TempDataFrame
 from ..exceptions import CSVReadError, CSVWriteError, ValidationError
 
+# Rows transposed into columns per batch when no chunk_size is given
+_DEFAULT_CHUNK_SIZE = 10000
 
-def read_csv(filename: str, chunk_size: Optional[int] = None) -> TempDataFrame:
+# Bytes read for dialect detection (one page covers a wide header plus rows)
+_SNIFF_SAMPLE_SIZE = 4096
+
+# File buffer size and rows per writerows() call for streaming writes
+_STREAM_BUFFER_SIZE = 1 << 22
+_STREAM_BATCH_SIZE = 8192
+
+# Rows joined per write() on the unquoted fast path
+_JOIN_BLOCK_SIZE = 65536
+
+# Value types written as str(value) and characters that force quoting
+_PLAIN_TYPES = frozenset((str, int, float, bool))
+_SPECIAL_CHARS = ',"\\\r\n'
+
+
+def read_csv(filename: str, chunk_size: Optional[int] = None, share_strings: bool = False) -> TempDataFrame:
     """
     Read CSV file into TempDataFrame.
     
+    Blank lines are skipped, including before the header. Every other row
+    must have exactly as many fields as the header.
+    
     Args:
         filename: Path to CSV file
-        chunk_size: Optional chunk size for streaming large files
+        chunk_size: Optional number of rows to read and transpose at a time
+        share_strings: If True, make repeated string values in
+            low-cardinality columns share one object. Saves memory on large
+            files at the cost of a slower read
         
     Returns:
         TempDataFrame containing the CSV data
@@ -38,46 +64,30 @@ def read_csv(filename: str, chunk_size: Optional[int] = None) -> TempDataFrame:
         if not isinstance(chunk_size, int) or chunk_size <= 0:
             raise ValidationError("chunk_size", chunk_size, "positive integer or None")
     
-    file_path = Path(filename)
+    if not isinstance(share_strings, bool):
+        raise ValidationError("share_strings", share_strings, "boolean")
     
     # Check if file exists
-    if not file_path.exists():
+    if not os.path.exists(filename):
         raise CSVReadError(filename, FileNotFoundError(f"No such file or directory: '{filename}'"))
     
     try:
-        data = []
-        columns = []
-        
-        with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
-            # Try to detect the CSV dialect
-            try:
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-                dialect = csv.Sniffer().sniff(sample)
-            except csv.Error:
-                # Fall back to default dialect if detection fails
-                dialect = csv.excel
-            
-            reader = csv.DictReader(csvfile, dialect=dialect)
+        with open(filename, 'r', encoding='utf-8', newline='') as csvfile:
+            dialect = _detect_dialect(csvfile)
+            reader = csv.reader(csvfile, dialect=dialect)
             
-            # Get column names from the first row
-            if reader.fieldnames:
-                columns = list(reader.fieldnames)
-            else:
+            # Get column names from the first non-blank row
+            columns = next(filter(None, reader), None)
+            if not columns:
                 raise CSVReadError(filename, Exception("No columns found - file may be empty or malformed"))
             
-            # Read data with optional chunking for large files
-            if chunk_size:
-                data = list(_read_csv_chunks(reader, chunk_size))
-            else:
-                try:
-                    data = list(reader)
-                    # Additional validation for malformed CSV
-                    _validate_csv_data(data, columns, filename)
-                except csv.Error as e:
-                    raise CSVReadError(filename, e)
+            column_lists = _read_csv_columns(reader, len(columns), chunk_size or _DEFAULT_CHUNK_SIZE, filename)
+        
+        column_data = dict(zip(columns, column_lists))
+        if share_strings:
+            share_repeated_strings(column_data)
         
-        return TempDataFrame(data, columns)
+        return TempDataFrame.from_columns(column_data, columns)
         
     except UnicodeDecodeError as e:
         raise CSVReadError(filename, e)
@@ -92,55 +102,189 @@ def read_csv(filename: str, chunk_size: Optional[int] = None) -> TempDataFrame:
         raise CSVReadError(filename, e)
 
 
-def _validate_csv_data(data: List[Dict[str, Any]], columns: List[str], filename: str) -> None:
+def _detect_dialect(csvfile) -> Type[csv.Dialect]:
     """
-    Validate CSV data for common malformation issues.
+    Detect the CSV dialect of an open file.
+    
+    Plain comma-separated headers (the format this library writes) use the
+    default dialect directly; anything else goes through csv.Sniffer.
     
     Args:
-        data: List of dictionaries containing the CSV data
-        columns: List of expected column names
+        csvfile: Open file object positioned at the start
+        
+    Returns:
+        Detected CSV dialect
+    """
+    first_line = csvfile.readline()
+    csvfile.seek(0)
+    
+    if ',' in first_line and ', ' not in first_line and not any(d in first_line for d in '\t;|'):
+        return csv.excel
+    
+    try:
+        sample = csvfile.read(_SNIFF_SAMPLE_SIZE)
+        csvfile.seek(0)
+        return csv.Sniffer().sniff(sample, delimiters=',;\t|')
+    except csv.Error:
+        # Fall back to default dialect if detection fails
+        csvfile.seek(0)
+        return csv.excel
+
+
+def _read_csv_columns(reader, num_columns: int, chunk_size: int, filename: str) -> List[List[str]]:
+    """
+    Read CSV rows into one list per column.
+    
+    Rows are read in chunks and transposed with zip(), so no per-row
+    dictionaries are created.
+    
+    Args:
+        reader: CSV reader positioned after the header row
+        num_columns: Number of columns in the header
+        chunk_size: Number of rows to read at a time
         filename: Filename for error reporting
         
+    Returns:
+        List of column value lists, in header order
+        
     Raises:
-        CSVReadError: If malformed data is detected
+        CSVReadError: If a row does not match the header (malformed data)
     """
-    if not data:
-        return  # Empty data is valid
+    column_lists: List[List[str]] = [[] for _ in range(num_columns)]
+    rows_read = 0
     
-    # Check for rows with inconsistent column counts or malformed data
-    for i, row in enumerate(data):
-        if not isinstance(row, dict):
-            raise CSVReadError(filename, Exception(f"Row {i+1} is not properly formatted"))
+    for chunk in iter(lambda: list(islice(reader, chunk_size)), []):
+        # Blank lines are skipped, as csv.DictReader does
+        rows = [row for row in chunk if row]
         
-        # Check for None keys or values (indicates malformed CSV parsing)
-        if None in row or None in row.values():
-            raise CSVReadError(filename, Exception(f"Row {i+1} contains malformed data - likely unclosed quotes or invalid CSV format"))
+        for i, row in enumerate(rows):
+            if len(row) != num_columns:
+                raise CSVReadError(filename, Exception(
+                    f"Row {rows_read + i + 1} contains malformed data - likely unclosed quotes or invalid CSV format"
+                ))
         
-        # Check for unexpected number of fields
-        if len(row) != len(columns):
-            # Allow for some flexibility, but flag obvious issues
-            if len(row) > len(columns) * 1.5:  # More than 50% extra fields
-                raise CSVReadError(filename, Exception(f"Row {i+1} has too many fields - possible malformed CSV"))
+        rows_read += len(rows)
+        for column, values in zip(column_lists, zip(*rows)):
+            column.extend(values)
+    
+    return column_lists
 
 
-def _read_csv_chunks(reader: csv.DictReader, chunk_size: int) -> Iterator[Dict[str, Any]]:
+def _make_writer(csvfile):
     """
-    Read CSV data in chunks to manage memory usage.
+    Create the CSV writer used for all output files.
     
     Args:
-        reader: CSV DictReader instance
-        chunk_size: Number of rows to read at a time
+        csvfile: Open file object to write to
+        
+    Returns:
+        csv.writer configured with the library's output dialect
+    """
+    return csv.writer(
+        csvfile,
+        quoting=csv.QUOTE_MINIMAL,
+        escapechar='\\',
+        lineterminator='\n'
+    )
+
+
+def _make_row_getter(columns: List[str]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """
+    Build a function that extracts column values from a row dictionary.
+    
+    Uses a precomputed itemgetter for the common case where every row has
+    all columns; rows with missing keys fall back to '' for those columns.
+    
+    Args:
+        columns: Column names in output order
+        
+    Returns:
+        Function mapping a row dictionary to a tuple of values
+    """
+    if not columns:
+        return lambda row: ()
+    
+    getter = itemgetter(*columns)
+    single = len(columns) == 1
+    
+    def get_row(row: Dict[str, Any]) -> Tuple[Any, ...]:
+        try:
+            values = getter(row)
+        except KeyError:
+            return tuple(row.get(col, '') for col in columns)
+        return (values,) if single else values
+    
+    return get_row
+
+
+def _plain_text_columns(column_values: List[List[Any]]) -> Optional[List[List[str]]]:
+    """
+    Convert columns to text if no value needs CSV quoting.
+    
+    A column qualifies when it holds only ints, floats, bools and strings,
+    and none of its strings contain a delimiter, quote, backslash or line
+    break. For these values csv.writer would emit str(value) unquoted.
+    
+    Args:
+        column_values: One list of values per column
+    
+    Returns:
+        One list of strings per column, or None if any value needs the
+        csv module's quoting rules
+    """
+    text_columns = []
+    
+    for values in column_values:
+        types = set(map(type, values))
+        if not types <= _PLAIN_TYPES:
+            return None
+        
+        if str in types:
+            # One joined string lets the special-character scan run in C
+            joined = '\x00'.join(value for value in values if type(value) is str)
+            if any(char in joined for char in _SPECIAL_CHARS):
+                return None
         
-    Yields:
-        Dictionary representing a row of data
+        text_columns.append(values if types <= {str} else list(map(str, values)))
+    
+    return text_columns
+
+
+def _write_plain_columns(csvfile, columns: List[str], column_values: List[List[Any]],
+                         lineterminator: str = '\n') -> bool:
     """
-    count = 0
-    for row in reader:
-        yield row
-        count += 1
-        if count % chunk_size == 0:
-            # This allows for memory management in very large files
-            pass
+    Write header and rows with str.join when no value needs quoting.
+    
+    Rows are joined in blocks of _JOIN_BLOCK_SIZE, so each block is a
+    single write() call and peak memory stays bounded.
+    
+    Args:
+        csvfile: Open text file to write to
+        columns: Column names in output order
+        column_values: One list of values per column, in the same order
+        lineterminator: Line terminator used by the equivalent csv.writer
+    
+    Returns:
+        True if the data was written, False if nothing was written and the
+        caller must fall back to csv.writer
+    """
+    # A lone empty field is quoted by csv.writer, so single columns go there
+    if len(columns) < 2:
+        return False
+    
+    text_columns = _plain_text_columns([list(columns)] + column_values)
+    if text_columns is None:
+        return False
+    
+    header, text_columns = text_columns[0], text_columns[1:]
+    csvfile.write(','.join(header) + lineterminator)
+    
+    num_rows = len(text_columns[0])
+    for start in range(0, num_rows, _JOIN_BLOCK_SIZE):
+        block = zip(*(values[start:start + _JOIN_BLOCK_SIZE] for values in text_columns))
+        csvfile.write(lineterminator.join(map(','.join, block)) + lineterminator)
+    
+    return True
 
 
 def write_csv(data: List[Dict[str, Any]], filename: str, columns: Optional[List[str]] = None) -> None:
@@ -179,39 +323,69 @@ def write_csv(data: List[Dict[str, Any]], filename: str, columns: Optional[List[
     if not all(isinstance(row, dict) for row in data):
         raise ValidationError("data", data, "list of dictionaries")
     
-    file_path = Path(filename)
-    
     # Create directory if it doesn't exist
-    try:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-    except OSError as e:
-        raise CSVWriteError(filename, e)
+    directory = os.path.dirname(filename)
+    if directory:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            raise CSVWriteError(filename, e)
     
     # Determine columns if not provided
     if columns is None:
         columns = list(data[0].keys()) if data else []
     
+    # Take only the specified columns in order; missing keys are ''
+    column_values = [[row.get(col, '') for row in data] for col in columns]
+    write_csv_columns(column_values, filename, columns)
+
+
+def write_csv_columns(column_values: List[List[Any]], filename: str, columns: List[str],
+                      lineterminator: str = '\n', escapechar: Optional[str] = '\\') -> None:
+    """
+    Write column lists to a CSV file.
+    
+    Values are joined as plain text when none of them needs quoting,
+    otherwise written with csv.writer. The file is written to a temporary
+    file and renamed, so a failed write never leaves a truncated CSV in
+    place.
+    
+    Args:
+        column_values: One list of values per column, all of equal length
+        filename: Path to output CSV file
+        columns: Column names, in the same order as column_values
+        lineterminator: Line terminator passed to csv.writer
+        escapechar: Escape character passed to csv.writer
+        
+    Raises:
+        ValidationError: If parameters are invalid
+        CSVWriteError: If writing fails
+    """
+    if not isinstance(filename, str):
+        raise ValidationError("filename", filename, "string")
+    
+    if not filename.strip():
+        raise ValidationError("filename", filename, "non-empty string")
+    
+    if len(column_values) != len(columns):
+        raise ValidationError("column_values", column_values, "one list per column")
+    
     try:
-        with open(file_path, 'w', encoding='utf-8', newline='') as csvfile:
-            writer = csv.DictWriter(
-                csvfile, 
-                fieldnames=columns,
-                quoting=csv.QUOTE_MINIMAL,
-                escapechar='\\',
-                lineterminator='\n'
-            )
+        with atomic_open(filename, 'w', encoding='utf-8', newline='', buffering=_STREAM_BUFFER_SIZE) as csvfile:
+            if _write_plain_columns(csvfile, columns, column_values, lineterminator):
+                return
+            
+            writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL,
+                                escapechar=escapechar, lineterminator=lineterminator)
             
             # Write header
-            writer.writeheader()
+            writer.writerow(columns)
             
             # Write data rows
-            for row in data:
-                try:
-                    # Filter row to only include specified columns
-                    filtered_row = {col: row.get(col, '') for col in columns}
-                    writer.writerow(filtered_row)
-                except csv.Error as e:
-                    raise CSVWriteError(filename, e)
+            try:
+                writer.writerows(zip(*column_values))
+            except csv.Error as e:
+                raise CSVWriteError(filename, e)
                     
     except PermissionError as e:
         raise CSVWriteError(filename, e)
@@ -253,35 +427,28 @@ def write_csv_streaming(data_generator: Iterator[Dict[str, Any]], filename: str,
     if not all(isinstance(col, str) for col in columns):
         raise ValidationError("columns", columns, "list of strings")
     
-    file_path = Path(filename)
-    
     # Create directory if it doesn't exist
-    try:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-    except OSError as e:
-        raise CSVWriteError(filename, e)
+    directory = os.path.dirname(filename)
+    if directory:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            raise CSVWriteError(filename, e)
     
     try:
-        with open(file_path, 'w', encoding='utf-8', newline='') as csvfile:
-            writer = csv.DictWriter(
-                csvfile,
-                fieldnames=columns,
-                quoting=csv.QUOTE_MINIMAL,
-                escapechar='\\',
-                lineterminator='\n'
-            )
+        with atomic_open(filename, 'w', encoding='utf-8', newline='', buffering=_STREAM_BUFFER_SIZE) as csvfile:
+            writer = _make_writer(csvfile)
             
             # Write header
-            writer.writeheader()
+            writer.writerow(columns)
             
-            # Write data rows from generator
-            for row in data_generator:
-                try:
-                    # Filter row to only include specified columns
-                    filtered_row = {col: row.get(col, '') for col in columns}
-                    writer.writerow(filtered_row)
-                except csv.Error as e:
-                    raise CSVWriteError(filename, e)
+            # Write data rows from generator in batches
+            rows = map(_make_row_getter(columns), data_generator)
+            try:
+                for batch in iter(lambda: list(islice(rows, _STREAM_BATCH_SIZE)), []):
+                    writer.writerows(batch)
+            except csv.Error as e:
+                raise CSVWriteError(filename, e)
                     
     except PermissionError as e:
         raise CSVWriteError(filename, e)
@@ -5,20 +5,285 @@ Handles reading and writing JSON files for the TempDataset library.
 """
 
 import json
+import math
 import os
-from typing import List, Dict, Any, Optional, Iterator, Union
-from pathlib import Path
+import mmap
+import re
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Union, Callable, Tuple
+from ._atomic import atomic_open
+from ._shared_strings import share_repeated_strings
 from ..utils.data_frame import TempDataFrame
 from ..exceptions import JSONReadError, JSONWriteError, ValidationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def read_json(filename: str, lines: bool = False) -> TempDataFrame:
+# Files at least this large are memory-mapped for parsing with orjson
+_MMAP_THRESHOLD = 1 << 20
+
+# Whitespace allowed before the first JSON token
+_LEADING_WHITESPACE = re.compile(rb'[ \t\r\n]*')
+
+# Value types the C encoder handles without nesting or a default function
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# isinstance(obj, dict) as a C-level callable for map()
+_is_dict = dict.__instancecheck__
+
+# Container types orjson and the standard library serialize the same way
+_CONTAINER_TYPES = frozenset((dict, list, tuple))
+_JSON_TYPES = _SCALAR_TYPES | _CONTAINER_TYPES
+
+# File buffer size and rows serialized per write() call for streaming writes
+_STREAM_BUFFER_SIZE = 1 << 20
+_WRITE_BATCH_SIZE = 1024
+
+
+def _loads(text: Union[str, bytes, memoryview]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Uses orjson when it is installed, otherwise the standard library. Input
+    orjson rejects is retried with the standard library, so both paths
+    accept the same documents (e.g. NaN literals) and raise the same
+    json.JSONDecodeError on invalid input.
+    
+    Args:
+        text: JSON document, as text or a UTF-8 encoded buffer
+        
+    Returns:
+        Parsed object
+        
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    # Parsing stays on one thread: orjson and json both hold the GIL while
+    # parsing, and worker processes would spend longer pickling the parsed
+    # rows back than parsing them
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # Fall back to the standard library below
+    
+    if isinstance(text, memoryview):
+        text = text.tobytes()  # The standard library needs str or bytes
+    return json.loads(text)
+
+
+@lru_cache(maxsize=None)
+def _encoder(indent: Optional[int], separators: Tuple[str, str],
+             default: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], str]:
+    """
+    Get a cached standard library encoder for one output layout.
+    
+    json.dumps() and json.dump() build a new JSONEncoder on every call that
+    passes options; caching one per layout skips that setup.
+    
+    Args:
+        indent: Indentation level, or None for single-line output
+        separators: (item_separator, key_separator) pair
+        default: Optional function converting unsupported values
+        
+    Returns:
+        Encode function of the cached encoder
+    """
+    return json.JSONEncoder(indent=indent, ensure_ascii=False, separators=separators, default=default).encode
+
+
+def _has_only_json_types(obj: Any) -> bool:
+    """
+    Check whether an object is built only from plain JSON types.
+    
+    orjson natively serializes types the standard library rejects or hands
+    to default (Enum, UUID, datetime, dataclasses, subclasses of str and
+    int, ...), so only objects made of exactly these types are guaranteed
+    to serialize the same way on both paths.
+    
+    Args:
+        obj: Object to check, walking into dicts, lists and tuples
+        
+    Returns:
+        True if obj only contains str, int, float, bool, None, dict, list
+        and tuple values
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        values = obj.values()
+    elif obj_type is list or obj_type is tuple:
+        values = obj
+    else:
+        return obj_type in _SCALAR_TYPES
+    
+    # One C-level pass over the value types; only nested containers recurse
+    value_types = set(map(type, values))
+    if value_types <= _SCALAR_TYPES:
+        return True
+    if not value_types <= _JSON_TYPES:
+        return False
+    if value_types == {dict}:
+        # A list of rows: check all row values in a single pass as well
+        row_values = list(chain.from_iterable(map(dict.values, values)))
+        value_types = set(map(type, row_values))
+        if value_types <= _SCALAR_TYPES:
+            return True
+        if not value_types <= _JSON_TYPES:
+            return False
+        values = row_values
+    return all(map(_has_only_json_types, values))
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """
+    Check whether an object contains a NaN or infinite float.
+    
+    Args:
+        obj: Object to check, walking into dicts, lists and tuples
+        
+    Returns:
+        True if any float in obj is NaN or infinite
+    """
+    if type(obj) is float:
+        return obj != obj or obj in (math.inf, -math.inf)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    return False
+
+
+def _orjson_dumps(obj: Any, indent: Optional[int],
+                  default: Optional[Callable[[Any], Any]]) -> Optional[bytes]:
+    """
+    Serialize an object with orjson, if it can match the standard library.
+    
+    orjson only supports compact and 2-space indented output, serializes
+    some types the standard library rejects or passes to default, and
+    writes NaN and Infinity as null. None is returned in those cases so
+    the caller falls back to the standard library.
+    
+    Args:
+        obj: Object to serialize
+        indent: Indentation level, or None for compact output
+        default: Optional function converting unsupported values
+        
+    Returns:
+        UTF-8 encoded JSON, or None if the standard library must be used
+    """
+    if orjson is None or indent not in (None, 2) or not _has_only_json_types(obj):
+        return None
+    
+    # Every value is a plain JSON type, so default is never needed; orjson
+    # still rejects non-string keys and integers beyond 64 bits
+    try:
+        result = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    except TypeError:
+        return None
+    
+    # Non-finite floats only ever show up as null, so the input is only
+    # scanned when the output contains one
+    if b'null' in result and _has_non_finite(obj):
+        return None
+    return result
+
+
+def _dumps_bytes(obj: Any, indent: Optional[int] = None,
+                 default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize an object to JSON as UTF-8 bytes.
+    
+    orjson already produces UTF-8 bytes, so output written to a binary file
+    skips the decode/encode round trip through str.
+    
+    Args:
+        obj: Object to serialize
+        indent: Indentation level, or None for compact output
+        default: Optional function converting unsupported values
+        
+    Returns:
+        UTF-8 encoded JSON
+        
+    Raises:
+        TypeError: If obj contains values that cannot be serialized
+        ValueError: If obj cannot be serialized
+    """
+    result = _orjson_dumps(obj, indent, default)
+    if result is not None:
+        return result
+    return _stdlib_dumps(obj, indent, default).encode('utf-8')
+
+
+def _dumps(obj: Any, indent: Optional[int] = None, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Uses orjson when it is installed and produces the same output as the
+    standard library: compact or 2-space indent, only plain JSON types and
+    no NaN or Infinity. Everything else goes through the standard library,
+    so the result never depends on whether orjson is installed.
+    
+    Args:
+        obj: Object to serialize
+        indent: Indentation level, or None for compact output
+        default: Optional function converting unsupported values
+        
+    Returns:
+        JSON string
+        
+    Raises:
+        TypeError: If obj contains values that cannot be serialized
+        ValueError: If obj cannot be serialized
+    """
+    result = _orjson_dumps(obj, indent, default)
+    if result is not None:
+        return result.decode('utf-8')
+    return _stdlib_dumps(obj, indent, default)
+
+
+def _stdlib_dumps(obj: Any, indent: Optional[int], default: Optional[Callable[[Any], Any]]) -> str:
+    """
+    Serialize an object to a JSON string with the standard library.
+    
+    Args:
+        obj: Object to serialize
+        indent: Indentation level, or None for compact output
+        default: Optional function converting unsupported values
+        
+    Returns:
+        JSON string
+    """
+    if indent is None:
+        return _encoder(None, (',', ':'), default)(obj)
+    
+    if type(obj) is dict and obj and all(type(v) in _SCALAR_TYPES for v in obj.values()):
+        # The standard library only uses its C encoder without indent; for a
+        # flat object the indented layout is just a different item separator
+        inner = _encoder(None, (',\n' + ' ' * indent, ': '))(obj)
+        return '{\n' + ' ' * indent + inner[1:-1] + '\n}'
+    
+    return _encoder(indent, (',', ': '), default)(obj)
+
+
+def read_json(filename: str, lines: Optional[bool] = None, nrows: Optional[int] = None,
+              share_strings: bool = False) -> TempDataFrame:
     """
     Read JSON file into TempDataFrame.
     
     Args:
         filename: Path to JSON file
-        lines: If True, treat as line-delimited JSON (JSONL)
+        lines: If True, treat as line-delimited JSON (JSONL); if False, as a
+            JSON array or single object; if None (default), detect the format
+            from the file contents
+        nrows: Optional number of rows to read from the start of a JSONL
+            file; the rest of the file is not read (requires lines=True)
+        share_strings: If True, make repeated string values in
+            low-cardinality columns share one object. Saves memory on large
+            files at the cost of a slower read
         
     Returns:
         TempDataFrame containing the JSON data
@@ -34,26 +299,47 @@ def read_json(filename: str, lines: bool = False) -> TempDataFrame:
     if not filename.strip():
         raise ValidationError("filename", filename, "non-empty string")
     
-    if not isinstance(lines, bool):
-        raise ValidationError("lines", lines, "boolean")
+    if lines is not None and not isinstance(lines, bool):
+        raise ValidationError("lines", lines, "boolean or None")
     
-    file_path = Path(filename)
+    if not isinstance(share_strings, bool):
+        raise ValidationError("share_strings", share_strings, "boolean")
     
-    # Check if file exists
-    if not file_path.exists():
-        raise JSONReadError(filename, FileNotFoundError(f"No such file or directory: '{filename}'"))
+    if nrows is not None:
+        if not isinstance(nrows, int) or nrows <= 0:
+            raise ValidationError("nrows", nrows, "positive integer or None")
+        if lines is not True:
+            raise ValidationError("nrows", nrows, "None unless lines=True",
+                                  "Only line-delimited JSON can be read partially.")
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as jsonfile:
-            if lines:
-                data = _read_jsonl(jsonfile, filename)
+        # Files are read once as raw bytes: format detection looks at the
+        # first structural byte and the parser skips a text-mode decode
+        with _open_for_reading(filename) as jsonfile:
+            if nrows is not None:
+                data = _read_jsonl(_read_head_lines(jsonfile, nrows), filename)
+            elif lines or orjson is None or os.fstat(jsonfile.fileno()).st_size < _MMAP_THRESHOLD:
+                data = _parse_json_document(jsonfile.read(), filename, lines)
             else:
-                data = _read_json_array(jsonfile, filename)
+                # Large files are parsed in place from the page cache instead
+                # of being copied into a bytes object first
+                with mmap.mmap(jsonfile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        data = _parse_json_document(view, filename, lines)
+                    finally:
+                        view.release()
         
         # Extract columns from the first row if data exists
         columns = list(data[0].keys()) if data else []
+        if not columns:
+            return TempDataFrame(data, columns)
+        
+        column_data = _rows_to_columns(data, columns)
+        if share_strings:
+            share_repeated_strings(column_data)
         
-        return TempDataFrame(data, columns)
+        return TempDataFrame.from_columns(column_data, columns)
         
     except UnicodeDecodeError as e:
         raise JSONReadError(filename, e)
@@ -68,12 +354,124 @@ def read_json(filename: str, lines: bool = False) -> TempDataFrame:
         raise JSONReadError(filename, e)
 
 
-def _read_json_array(jsonfile, filename: str) -> List[Dict[str, Any]]:
+def _read_head_lines(jsonfile, nrows: int) -> bytes:
+    """
+    Read lines from the start of a JSONL file up to a number of records.
+    
+    Blank lines are kept so parse errors still report the right line.
+    
+    Args:
+        jsonfile: File object opened in binary mode
+        nrows: Number of non-blank lines to read
+        
+    Returns:
+        Raw bytes of the lines read
+    """
+    head = []
+    remaining = nrows
+    for line in jsonfile:
+        head.append(line)
+        if not line.isspace():
+            remaining -= 1
+            if not remaining:
+                break
+    return b''.join(head)
+
+
+def _parse_json_document(raw: Union[bytes, memoryview], filename: str, lines: Optional[bool]) -> List[Dict[str, Any]]:
+    """
+    Parse a JSON file's contents in the requested or detected format.
+    
+    Args:
+        raw: Raw file contents
+        filename: Filename for error messages
+        lines: True for JSONL, False for an array or object, None to detect
+        
+    Returns:
+        List of dictionaries representing the data
+        
+    Raises:
+        JSONReadError: If JSON parsing fails
+    """
+    if lines:
+        return _read_jsonl(raw, filename)
+    
+    if lines is False or _first_byte(raw) != b'{':
+        return _read_json_array(raw, filename)
+    
+    # A leading object is either a single JSON object or JSONL
+    try:
+        return _read_json_array(raw, filename)
+    except JSONReadError:
+        return _read_jsonl(raw, filename)
+
+
+def _rows_to_columns(data: List[Dict[str, Any]], columns: List[str]) -> Dict[str, List[Any]]:
+    """
+    Pivot parsed rows into one list per column.
+    
+    Uniform rows are transposed with itemgetter and zip in C; if any row
+    lacks a column, values are taken with dict.get so missing keys become None.
+    
+    Args:
+        data: Parsed rows
+        columns: Column names, taken from the first row
+        
+    Returns:
+        Dictionary mapping each column name to its list of values
+    """
+    if len(columns) == 1:
+        col = columns[0]
+        return {col: [row.get(col) for row in data]}
+    
+    try:
+        transposed = zip(*map(itemgetter(*columns), data))
+        return {col: list(values) for col, values in zip(columns, transposed)}
+    except KeyError:
+        return {col: [row.get(col) for row in data] for col in columns}
+
+
+def _open_for_reading(filename: str):
+    """
+    Open a JSON file for binary reading.
+    
+    The open call doubles as the existence check, saving a separate stat.
+    
+    Args:
+        filename: Path to JSON file
+        
+    Returns:
+        File object opened in binary mode
+        
+    Raises:
+        JSONReadError: If the file does not exist
+    """
+    try:
+        return open(filename, 'rb')
+    except FileNotFoundError:
+        raise JSONReadError(filename, FileNotFoundError(f"No such file or directory: '{filename}'")) from None
+
+
+def _first_byte(raw: Union[bytes, memoryview]) -> bytes:
+    """
+    Get the first non-whitespace byte of a JSON document.
+    
+    Args:
+        raw: Raw file contents
+        
+    Returns:
+        First structural byte, or b'' if the document is blank
+    """
+    start = _LEADING_WHITESPACE.match(raw).end()
+    return bytes(raw[start:start + 1])
+
+
+def _read_json_array(raw: Union[bytes, memoryview], filename: str) -> List[Dict[str, Any]]:
     """
     Read JSON file as array of objects.
     
     Args:
-        jsonfile: Open file object
+        raw: Raw file contents
         filename: Filename for error messages
         
     Returns:
@@ -83,13 +481,15 @@ def _read_json_array(jsonfile, filename: str) -> List[Dict[str, Any]]:
         JSONReadError: If JSON parsing fails
     """
     try:
-        content = json.load(jsonfile)
+        content = _loads(raw)
         
         if isinstance(content, list):
-            # Validate that all items are dictionaries
-            for i, item in enumerate(content):
-                if not isinstance(item, dict):
-                    raise JSONReadError(filename, Exception(f"Item {i} in JSON array is not an object"))
+            # Validate that all items are dictionaries; the check runs in C
+            # and items are only walked to report the first bad index
+            if not all(map(_is_dict, content)):
+                for i, item in enumerate(content):
+                    if not isinstance(item, dict):
+                        raise JSONReadError(filename, Exception(f"Item {i} in JSON array is not an object"))
             return content
         elif isinstance(content, dict):
             # Single object, wrap in list
@@ -101,12 +501,16 @@ def _read_json_array(jsonfile, filename: str) -> List[Dict[str, Any]]:
         raise JSONReadError(filename, e)
 
 
-def _read_jsonl(jsonfile, filename: str) -> List[Dict[str, Any]]:
+def _read_jsonl(raw: Union[bytes, memoryview], filename: str) -> List[Dict[str, Any]]:
     """
     Read line-delimited JSON file.
     
+    The whole file is split into lines in one call and parsed in a single
+    comprehension; lines are only walked one by one to locate the
+    offending line when something is wrong.
+    
     Args:
-        jsonfile: Open file object
+        raw: Raw file contents
         filename: Filename for error messages
         
     Returns:
@@ -115,25 +519,42 @@ def _read_jsonl(jsonfile, filename: str) -> List[Dict[str, Any]]:
     Raises:
         JSONReadError: If JSON parsing fails
     """
-    data = []
-    line_number = 0
+    lines = bytes(raw).splitlines()
     
-    for line in jsonfile:
-        line_number += 1
-        line = line.strip()
+    try:
+        # isspace() checks blank lines without allocating a stripped copy
+        data = [_loads(line) for line in lines if line and not line.isspace()]
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        data = None
+    
+    if data is None or not all(isinstance(obj, dict) for obj in data):
+        _raise_jsonl_error(lines, filename)
+    
+    return data
+
+
+def _raise_jsonl_error(lines: List[bytes], filename: str) -> None:
+    """
+    Find the first invalid line of a line-delimited JSON file and raise.
+    
+    Args:
+        lines: Raw lines of the file
+        filename: Filename for error messages
         
-        if not line:  # Skip empty lines
+    Raises:
+        JSONReadError: Describing the first line that is not a JSON object
+    """
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():  # Skip empty lines
             continue
-            
+        
         try:
-            obj = json.loads(line)
-            if not isinstance(obj, dict):
-                raise JSONReadError(filename, Exception(f"Line {line_number} is not a JSON object"))
-            data.append(obj)
-        except json.JSONDecodeError as e:
+            obj = _loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise JSONReadError(filename, Exception(f"Invalid JSON on line {line_number}: {str(e)}"))
-    
-    return data
+        
+        if not isinstance(obj, dict):
+            raise JSONReadError(filename, Exception(f"Line {line_number} is not a JSON object"))
 
 
 def write_json(data: List[Dict[str, Any]], filename: str, lines: bool = False, indent: Optional[int] = 2) -> None:
@@ -173,16 +594,18 @@ def write_json(data: List[Dict[str, Any]], filename: str, lines: bool = False, i
     if not all(isinstance(row, dict) for row in data):
         raise ValidationError("data", data, "list of dictionaries")
     
-    file_path = Path(filename)
-    
     # Create directory if it doesn't exist
-    try:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-    except OSError as e:
-        raise JSONWriteError(filename, e)
+    directory = os.path.dirname(filename)
+    if directory:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            raise JSONWriteError(filename, e)
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as jsonfile:
+        # Written to a temporary file and renamed, so a failed write never
+        # leaves a truncated JSON file in place
+        with atomic_open(filename, 'wb') as jsonfile:
             if lines:
                 _write_jsonl(data, jsonfile, filename)
             else:
@@ -205,7 +628,7 @@ def _write_json_array(data: List[Dict[str, Any]], jsonfile, filename: str, inden
     
     Args:
         data: List of dictionaries
-        jsonfile: Open file object
+        jsonfile: File object opened in binary mode
         filename: Filename for error messages
         indent: Indentation level
         
@@ -213,27 +636,70 @@ def _write_json_array(data: List[Dict[str, Any]], jsonfile, filename: str, inden
         JSONWriteError: If writing fails
     """
     try:
-        json.dump(data, jsonfile, indent=indent, ensure_ascii=False, separators=(',', ': '))
+        if indent is None:
+            jsonfile.write(_encoder(None, (',', ': '))(data).encode('utf-8'))
+        elif orjson is None or indent != 2:
+            # Serialize row by row so flat rows take the C encoder path
+            pad = ' ' * indent
+            rows = (_dumps(row, indent=indent).replace('\n', '\n' + pad) for row in data)
+            jsonfile.write(('[\n' + pad + (',\n' + pad).join(rows) + '\n]').encode('utf-8'))
+        else:
+            jsonfile.write(_dumps_bytes(data, indent))
     except (TypeError, ValueError) as e:
         raise JSONWriteError(filename, e)
 
 
-def _write_jsonl(data: List[Dict[str, Any]], jsonfile, filename: str) -> None:
+def _write_jsonl(data: Iterable[Dict[str, Any]], jsonfile, filename: str) -> None:
     """
     Write data as line-delimited JSON.
     
+    Rows are serialized straight to UTF-8 bytes in fixed-size batches, then
+    joined and written with one write() call per batch. A failing batch is
+    re-serialized row by row to report the offending row.
+    
     Args:
-        data: List of dictionaries
-        jsonfile: Open file object
+        data: Iterable of dictionaries
+        jsonfile: File object opened in binary mode
         filename: Filename for error messages
         
     Raises:
         JSONWriteError: If writing fails
     """
-    for i, row in enumerate(data):
+    # Rows of generated datasets share one schema, but formatting them through
+    # a per-schema template is slower than the C encoders: the template has to
+    # escape every value from Python, while orjson and json's c_make_encoder
+    # handle the whole dict in a single call.
+    dumps = _dumps_bytes
+    rows = iter(data)
+    start = 0
+    while True:
+        batch = list(islice(rows, _WRITE_BATCH_SIZE))
+        if not batch:
+            break
         try:
-            json_line = json.dumps(row, ensure_ascii=False, separators=(',', ':'))
-            jsonfile.write(json_line + '\n')
+            chunks = [dumps(row) for row in batch]
+        except (TypeError, ValueError):
+            _raise_jsonl_write_error(batch, start, filename)
+        chunks.append(b'')
+        jsonfile.write(b'\n'.join(chunks))
+        start += len(batch)
+
+
+def _raise_jsonl_write_error(batch: List[Dict[str, Any]], start: int, filename: str) -> None:
+    """
+    Find the first row of a batch that fails to serialize and raise for it.
+    
+    Args:
+        batch: Rows of the batch that failed
+        start: Index of the first row of the batch
+        filename: Filename for error messages
+        
+    Raises:
+        JSONWriteError: Always, naming the failing row
+    """
+    for i, row in enumerate(batch, start):
+        try:
+            _dumps_bytes(row)
         except (TypeError, ValueError) as e:
             raise JSONWriteError(filename, Exception(f"Error serializing row {i}: {str(e)}"))
 
@@ -245,7 +711,8 @@ def write_json_streaming(data_generator: Iterator[Dict[str, Any]], filename: str
     Args:
         data_generator: Iterator yielding dictionaries of data
         filename: Path to output JSON file
-        lines: If True, write as line-delimited JSON (recommended for streaming)
+        lines: If True, write as line-delimited JSON (recommended for streaming);
+            if False, write an indented JSON array one row at a time
         
     Raises:
         ValidationError: If parameters are invalid
@@ -264,25 +731,21 @@ def write_json_streaming(data_generator: Iterator[Dict[str, Any]], filename: str
     if not isinstance(lines, bool):
         raise ValidationError("lines", lines, "boolean")
     
-    if not lines:
-        raise JSONWriteError(filename, Exception("Streaming JSON writing only supports line-delimited format (lines=True)"))
-    
-    file_path = Path(filename)
-    
     # Create directory if it doesn't exist
-    try:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-    except OSError as e:
-        raise JSONWriteError(filename, e)
+    directory = os.path.dirname(filename)
+    if directory:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            raise JSONWriteError(filename, e)
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as jsonfile:
-            for i, row in enumerate(data_generator):
-                try:
-                    json_line = json.dumps(row, ensure_ascii=False, separators=(',', ':'))
-                    jsonfile.write(json_line + '\n')
-                except (TypeError, ValueError) as e:
-                    raise JSONWriteError(filename, Exception(f"Error serializing row {i}: {str(e)}"))
+        if lines:
+            with atomic_open(filename, 'wb', buffering=_STREAM_BUFFER_SIZE) as jsonfile:
+                _write_jsonl(data_generator, jsonfile, filename)
+        else:
+            with atomic_open(filename, 'wb', buffering=_STREAM_BUFFER_SIZE) as jsonfile:
+                _write_json_array_streaming(data_generator, jsonfile, filename)
                     
     except PermissionError as e:
         raise JSONWriteError(filename, e)
@@ -295,6 +758,42 @@ def write_json_streaming(data_generator: Iterator[Dict[str, Any]], filename: str
         raise JSONWriteError(filename, e)
 
 
+def _write_json_array_streaming(data_generator: Iterator[Dict[str, Any]], jsonfile, filename: str) -> None:
+    """
+    Write rows as an indented JSON array without building the full list.
+    
+    Produces the same layout as json.dump(data, indent=2).
+    
+    Args:
+        data_generator: Iterator yielding dictionaries of data
+        jsonfile: File object opened in binary mode
+        filename: Filename for error messages
+        
+    Raises:
+        JSONWriteError: If writing fails
+    """
+    batch = []
+    rows_written = 0
+    for i, row in enumerate(data_generator):
+        try:
+            row_json = _dumps_bytes(row, indent=2, default=str)
+        except (TypeError, ValueError) as e:
+            raise JSONWriteError(filename, Exception(f"Error serializing row {i}: {str(e)}"))
+        batch.append(row_json.replace(b'\n', b'\n  '))
+        
+        if len(batch) >= _WRITE_BATCH_SIZE:
+            jsonfile.write((b',\n  ' if rows_written else b'[\n  ') + b',\n  '.join(batch))
+            rows_written += len(batch)
+            batch.clear()
+    
+    if batch:
+        jsonfile.write((b',\n  ' if rows_written else b'[\n  ') + b',\n  '.join(batch))
+        rows_written += len(batch)
+    
+    # An empty iterator still produces a valid (empty) array
+    jsonfile.write(b'\n]' if rows_written else b'[]')
+
+
 def detect_json_format(filename: str) -> str:
     """
     Detect whether a JSON file is array format or line-delimited format.
@@ -316,27 +815,21 @@ def detect_json_format(filename: str) -> str:
     if not filename.strip():
         raise ValidationError("filename", filename, "non-empty string")
     
-    file_path = Path(filename)
-    
-    if not file_path.exists():
-        raise JSONReadError(filename, FileNotFoundError(f"No such file or directory: '{filename}'"))
-    
     try:
-        with open(file_path, 'r', encoding='utf-8') as jsonfile:
-            # Read first few characters to detect format
+        # The structural characters are single ASCII bytes, so no decoding
+        # is needed to tell the formats apart
+        with _open_for_reading(filename) as jsonfile:
             first_char = jsonfile.read(1)
             if not first_char:
                 raise JSONReadError(filename, Exception("Empty JSON file"))
             
-            if first_char == '[':
+            if first_char == b'[':
                 return 'array'
-            elif first_char == '{':
+            elif first_char == b'{':
                 return 'lines'
             else:
                 raise JSONReadError(filename, Exception("Unrecognized JSON format"))
                 
-    except UnicodeDecodeError as e:
-        raise JSONReadError(filename, e)
     except OSError as e:
         raise JSONReadError(filename, e)
     except Exception as e:
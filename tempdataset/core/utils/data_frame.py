@@ -4,11 +4,9 @@ TempDataFrame class for data manipulation.
 Provides a lightweight alternative to pandas DataFrame with essential data exploration methods.
 """
 
-import csv
-import json
 import sys
-from typing import List, Dict, Any, Tuple, Union
-from ..exceptions import ValidationError, CSVWriteError, JSONWriteError
+from typing import List, Dict, Any, Tuple, Union, Iterator, Optional
+from ..exceptions import ValidationError, CSVWriteError, JSONWriteError, ParquetWriteError
 
 
 class ShapeDescriptor:
@@ -20,10 +18,9 @@ class ShapeDescriptor:
         
         # Create a callable object that returns the shape tuple
         class ShapeCallable:
-            def __init__(self, data, columns):
-                self._data = data
+            def __init__(self, num_rows, columns):
                 self._columns = columns
-                self._shape = (len(data), len(columns))
+                self._shape = (num_rows, len(columns))
             
             def __call__(self):
                 """Allow calling as method: df.shape()"""
@@ -53,11 +50,16 @@ class ShapeDescriptor:
                 """Length (always 2 for shape tuple)"""
                 return 2
         
-        return ShapeCallable(obj._data, obj._columns)
+        return ShapeCallable(len(obj), obj._columns)
 
 
 class DisplayFormatter:
-    """Helper class to format output for Jupyter/Colab display."""
+    """
+    Helper class to format output for Jupyter/Colab display.
+    
+    Holds text that is rendered once when the formatter is created; str(),
+    repr() and comparisons return it without formatting the rows again.
+    """
     
     def __init__(self, content: str):
         self.content = content
@@ -96,6 +98,12 @@ class TempDataFrame:
     Lightweight DataFrame-like class for data manipulation and exploration.
     
     Provides essential methods for working with tabular data without pandas dependency.
+    
+    Frames produced by the library's generators and readers are column-backed
+    (see from_columns()): one list per column, with row dictionaries built
+    only on demand. Frames constructed from a list of row dictionaries keep
+    that list as given, so the caller's rows, including any keys outside
+    ``columns``, are returned unchanged.
     """
     
     def __init__(self, data: List[Dict[str, Any]], columns: List[str]):
@@ -120,11 +128,91 @@ class TempDataFrame:
             raise ValidationError("columns", columns, "list of strings")
         
         # Validate that data contains dictionaries (if not empty)
-        if data and not all(isinstance(row, dict) for row in data):
+        if data and not all(map(dict.__instancecheck__, data)):
             raise ValidationError("data", data, "list of dictionaries")
         
-        self._data = data
+        self._rows = data
+        self._column_data = None
         self._columns = columns
+        self._num_rows = None  # Row-backed frames take their length from _rows
+    
+    @classmethod
+    def from_columns(cls, column_data: Dict[str, List[Any]], columns: Optional[List[str]] = None) -> 'TempDataFrame':
+        """
+        Create a TempDataFrame from column-oriented data.
+        
+        Stores one list per column instead of one dictionary per row. Row
+        dictionaries are only built when a caller asks for them.
+        
+        Args:
+            column_data: Dictionary mapping column names to lists of values
+            columns: Optional list of column names to specify order
+            
+        Returns:
+            New TempDataFrame backed by the given column lists
+            
+        Raises:
+            ValidationError: If parameters are invalid
+        """
+        if not isinstance(column_data, dict):
+            raise ValidationError("column_data", column_data, "dictionary of lists")
+        
+        if columns is None:
+            columns = list(column_data.keys())
+        
+        if not isinstance(columns, list):
+            raise ValidationError("columns", columns, "list of strings")
+        
+        if not all(isinstance(col, str) for col in columns):
+            raise ValidationError("columns", columns, "list of strings")
+        
+        missing_cols = [col for col in columns if col not in column_data]
+        if missing_cols:
+            raise ValidationError("columns", missing_cols, "columns that exist in column_data")
+        
+        if not all(isinstance(column_data[col], list) for col in columns):
+            raise ValidationError("column_data", column_data, "dictionary of lists")
+        
+        lengths = {len(column_data[col]) for col in columns}
+        if len(lengths) > 1:
+            raise ValidationError("column_data", column_data, "columns of equal length")
+        
+        df = cls.__new__(cls)
+        df._rows = None
+        df._column_data = {col: column_data[col] for col in columns}
+        df._columns = columns
+        df._num_rows = lengths.pop() if lengths else 0
+        return df
+    
+    @property
+    def _data(self) -> List[Dict[str, Any]]:
+        """
+        Row-oriented view of the data.
+        
+        For column-backed frames the row dictionaries are built on first
+        access and cached.
+        
+        Returns:
+            List of dictionaries representing rows
+        """
+        if self._rows is None:
+            self._rows = list(self)
+        return self._rows
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over rows as dictionaries.
+        
+        Yields:
+            Dictionary representing a row of data
+        """
+        if self._rows is not None:
+            yield from self._rows
+            return
+        
+        columns = self._columns
+        for values in zip(*(self._column_data[col] for col in columns)):
+            yield dict(zip(columns, values))
     
     def __len__(self) -> int:
         """
@@ -133,7 +221,44 @@ class TempDataFrame:
         Returns:
             Number of rows
         """
-        return len(self._data)
+        if self._rows is not None:
+            return len(self._rows)
+        return self._num_rows
+    
+    def _column_values(self, col: str) -> List[Any]:
+        """
+        Get all values of a column.
+        
+        Args:
+            col: Column name
+            
+        Returns:
+            List of column values (None where a row has no value)
+        """
+        if self._column_data is not None:
+            return self._column_data[col]
+        return [row.get(col) for row in self._rows]
+    
+    def _slice_rows(self, start: Optional[int], stop: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        Get a slice of rows without materializing the whole frame.
+        
+        Args:
+            start: Slice start index
+            stop: Slice stop index
+            
+        Returns:
+            List of row dictionaries in the slice
+        """
+        if self._rows is not None:
+            return self._rows[start:stop]
+        
+        columns = self._columns
+        column_lists = [self._column_data[col] for col in columns]
+        return [
+            dict(zip(columns, [values[i] for values in column_lists]))
+            for i in range(self._num_rows)[start:stop]
+        ]
     
     def head(self, n: int = 5) -> DisplayFormatter:
         """
@@ -155,11 +280,11 @@ class TempDataFrame:
         if n <= 0:
             raise ValidationError("n", n, "positive integer")
         
-        if not self._data:
+        if not len(self):
             result = DisplayFormatter("Empty DataFrame")
         else:
             # Get the first n rows
-            rows_to_show = self._data[:n]
+            rows_to_show = self._slice_rows(None, n)
             result = DisplayFormatter(self._format_rows(rows_to_show))
         
         # Auto-print in script context
@@ -186,11 +311,11 @@ class TempDataFrame:
         if n <= 0:
             raise ValidationError("n", n, "positive integer")
         
-        if not self._data:
+        if not len(self):
             result = DisplayFormatter("Empty DataFrame")
         else:
             # Get the last n rows
-            rows_to_show = self._data[-n:]
+            rows_to_show = self._slice_rows(-n, None)
             result = DisplayFormatter(self._format_rows(rows_to_show))
         
         # Auto-print in script context
@@ -217,7 +342,7 @@ class TempDataFrame:
         Returns:
             DisplayFormatter object with statistical summary
         """
-        if not self._data:
+        if not len(self):
             result = DisplayFormatter("Empty DataFrame")
         else:
             # Find numeric columns
@@ -225,8 +350,7 @@ class TempDataFrame:
             for col in self._columns:
                 # Check if column contains numeric data
                 has_numeric = False
-                for row in self._data:
-                    value = row.get(col)
+                for value in self._column_values(col):
                     if value is not None and isinstance(value, (int, float)) and not isinstance(value, bool):
                         has_numeric = True
                         break
@@ -240,8 +364,7 @@ class TempDataFrame:
                 stats = {}
                 for col in numeric_cols:
                     values = []
-                    for row in self._data:
-                        value = row.get(col)
+                    for value in self._column_values(col):
                         if value is not None and isinstance(value, (int, float)) and not isinstance(value, bool):
                             values.append(float(value))
                     
@@ -322,7 +445,7 @@ class TempDataFrame:
         Returns:
             DisplayFormatter object with dataset information
         """
-        if not self._data:
+        if not len(self):
             result = DisplayFormatter("Empty DataFrame")
         else:
             rows, cols = self.shape
@@ -330,12 +453,12 @@ class TempDataFrame:
             # Calculate column types and non-null counts
             column_info = []
             for col in self._columns:
-                non_null_count = sum(1 for row in self._data if row.get(col) is not None)
+                values = self._column_values(col)
+                non_null_count = len(values) - values.count(None)
                 
                 # Determine data type from first non-null value
                 dtype = "object"
-                for row in self._data:
-                    value = row.get(col)
+                for value in values:
                     if value is not None:
                         if isinstance(value, int):
                             dtype = "int64"
@@ -398,27 +521,25 @@ class TempDataFrame:
         if not filename.strip():
             raise ValidationError("filename", filename, "non-empty string")
         
-        try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                if not self._data:
-                    # Write just headers for empty DataFrame
-                    writer = csv.writer(csvfile)
-                    writer.writerow(self._columns)
-                    return
-                
-                writer = csv.DictWriter(csvfile, fieldnames=self._columns)
-                writer.writeheader()
-                writer.writerows(self._data)
-                
-        except PermissionError as e:
-            raise CSVWriteError(filename, e)
-        except OSError as e:
-            raise CSVWriteError(filename, e)
-        except Exception as e:
-            # Catch any other unexpected errors
-            if isinstance(e, (ValidationError, CSVWriteError)):
-                raise  # Re-raise our custom exceptions
-            raise CSVWriteError(filename, e)
+        from ..io.csv_handler import write_csv_columns
+        
+        columns = self._columns
+        if self._column_data is not None:
+            column_values = [self._column_data[col] for col in columns]
+        else:
+            # Rows with keys outside the columns are rejected, as
+            # csv.DictWriter did
+            column_set = frozenset(columns)
+            if not all(map(column_set.issuperset, self._rows)):
+                row = next(row for row in self._rows if not column_set.issuperset(row))
+                extra = [key for key in row if key not in column_set]
+                raise CSVWriteError(filename, ValueError(
+                    "dict contains fields not in fieldnames: " + ", ".join(map(repr, extra))
+                ))
+            column_values = [[row.get(col, '') for row in self._rows] for col in columns]
+        
+        # Same layout as csv.writer's default excel dialect
+        write_csv_columns(column_values, filename, columns, lineterminator='\r\n', escapechar=None)
     
     def to_json(self, filename: str) -> None:
         """
@@ -439,8 +560,22 @@ class TempDataFrame:
             raise ValidationError("filename", filename, "non-empty string")
         
         try:
-            with open(filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(self._data, jsonfile, indent=2, default=str)
+            # Serialize through the JSON handler so orjson is used when it is
+            # installed; its output is already UTF-8 bytes
+            from ..io.json_handler import _dumps_bytes
+            if self._rows is not None:
+                rows = self._rows
+            else:
+                # Build the rows for this call only, rather than caching them
+                # on the frame through _data
+                columns = tuple(self._columns)
+                rows = [
+                    dict(zip(columns, values))
+                    for values in zip(*(self._column_data[col] for col in columns))
+                ]
+            
+            with open(filename, 'wb') as jsonfile:
+                jsonfile.write(_dumps_bytes(rows, indent=2, default=str))
                 
         except PermissionError as e:
             raise JSONWriteError(filename, e)
@@ -454,6 +589,50 @@ class TempDataFrame:
                 raise  # Re-raise our custom exceptions
             raise JSONWriteError(filename, e)
     
+    def to_parquet(self, filename: str) -> None:
+        """
+        Export to Parquet file.
+        
+        Requires the optional pyarrow dependency. Columns are written with
+        dictionary encoding and zstd compression, which keeps repetitive
+        categorical columns small.
+        
+        Args:
+            filename: Path to output Parquet file
+            
+        Raises:
+            ValidationError: If filename is invalid
+            ParquetWriteError: If pyarrow is missing or Parquet writing fails
+        """
+        # Validate input parameter
+        if not isinstance(filename, str):
+            raise ValidationError("filename", filename, "string")
+        
+        if not filename.strip():
+            raise ValidationError("filename", filename, "non-empty string")
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ParquetWriteError(filename, e)
+        
+        try:
+            table = pa.Table.from_pydict(
+                {col: self._column_values(col) for col in self._columns}
+            )
+            pq.write_table(table, filename, compression='zstd', use_dictionary=True)
+            
+        except PermissionError as e:
+            raise ParquetWriteError(filename, e)
+        except OSError as e:
+            raise ParquetWriteError(filename, e)
+        except Exception as e:
+            # Catch any other unexpected errors (e.g. mixed-type columns)
+            if isinstance(e, (ValidationError, ParquetWriteError)):
+                raise  # Re-raise our custom exceptions
+            raise ParquetWriteError(filename, e)
+    
     def _format_rows(self, rows: List[Dict[str, Any]]) -> str:
         """
         Format rows for display.
@@ -520,21 +699,11 @@ class TempDataFrame:
         Returns:
             Human-readable memory usage string
         """
-        if not self._data:
+        if not len(self):
             return "0 bytes"
         
         # Rough estimation based on Python object sizes
-        total_bytes = 0
-        
-        # Base object overhead
-        total_bytes += sys.getsizeof(self._data)
-        total_bytes += sys.getsizeof(self._columns)
-        
-        # Data content
-        for row in self._data:
-            total_bytes += sys.getsizeof(row)
-            for value in row.values():
-                total_bytes += sys.getsizeof(value)
+        total_bytes = self._estimate_memory_bytes()
         
         # Convert to human readable format
         if total_bytes < 1024:
@@ -544,6 +713,30 @@ class TempDataFrame:
         else:
             return f"{total_bytes / (1024 * 1024):.1f} MB"
     
+    def _estimate_memory_bytes(self) -> int:
+        """
+        Estimate the size of the stored data in bytes.
+        
+        Returns:
+            Approximate number of bytes used by the data
+        """
+        # Base object overhead
+        total_bytes = sys.getsizeof(self._columns)
+        
+        # Data content
+        if self._column_data is not None:
+            getsizeof = sys.getsizeof
+            for values in self._column_data.values():
+                total_bytes += getsizeof(values) + sum(map(getsizeof, values))
+        else:
+            total_bytes += sys.getsizeof(self._rows)
+            for row in self._rows:
+                total_bytes += sys.getsizeof(row)
+                for value in row.values():
+                    total_bytes += sys.getsizeof(value)
+        
+        return total_bytes
+    
     def memory_usage(self) -> float:
         """
         Get memory usage in megabytes.
@@ -551,21 +744,11 @@ class TempDataFrame:
         Returns:
             Memory usage in MB as a float
         """
-        if not self._data:
+        if not len(self):
             return 0.0
         
         # Rough estimation based on Python object sizes
-        total_bytes = 0
-        
-        # Base object overhead
-        total_bytes += sys.getsizeof(self._data)
-        total_bytes += sys.getsizeof(self._columns)
-        
-        # Data content
-        for row in self._data:
-            total_bytes += sys.getsizeof(row)
-            for value in row.values():
-                total_bytes += sys.getsizeof(value)
+        total_bytes = self._estimate_memory_bytes()
         
         # Return as MB
         return total_bytes / (1024 * 1024)
@@ -586,11 +769,14 @@ class TempDataFrame:
         if not callable(condition_func):
             raise ValidationError("condition_func", condition_func, "callable function")
         
+        # Rows built from columns are already fresh dictionaries
+        copy_rows = self._rows is not None
+        
         filtered_data = []
-        for row in self._data:
+        for row in self:
             try:
                 if condition_func(row):
-                    filtered_data.append(row.copy())
+                    filtered_data.append(row.copy() if copy_rows else row)
             except Exception as e:
                 # Skip rows that cause errors in the condition function
                 continue
@@ -621,6 +807,13 @@ class TempDataFrame:
         if missing_cols:
             raise ValidationError("columns", missing_cols, f"columns that exist in DataFrame. Available columns: {self._columns}")
         
+        # Column-backed frames only need the selected column lists
+        if self._column_data is not None:
+            return TempDataFrame.from_columns(
+                {col: list(self._column_data[col]) for col in columns},
+                columns.copy()
+            )
+        
         # Create new data with only selected columns
         selected_data = []
         for row in self._data:
@@ -636,7 +829,9 @@ class TempDataFrame:
         Returns:
             List of dictionaries representing the data
         """
-        return [row.copy() for row in self._data]
+        if self._rows is None:
+            return list(self)
+        return [row.copy() for row in self._rows]
     
     def _get_dtype_counts(self) -> str:
         """
@@ -645,7 +840,7 @@ class TempDataFrame:
         Returns:
             String describing data type distribution
         """
-        if not self._data:
+        if not len(self):
             return "no data"
         
         dtype_counts = {}
@@ -653,8 +848,7 @@ class TempDataFrame:
         for col in self._columns:
             # Determine data type from first non-null value
             dtype = "object"
-            for row in self._data:
-                value = row.get(col)
+            for value in self._column_values(col):
                 if value is not None:
                     if isinstance(value, int):
                         dtype = "int64"
@@ -0,0 +1,116 @@
+"""
+Shared pytest configuration for the TempDataset test suite.
+"""
+
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+
+import pytest
+import tempdataset
+from tempdataset.core.datasets.employees import EmployeesDataset
+
+# TMPDIR and tempfile.tempdir as they were before --shm-tmpdir changed them
+_saved_tmpdir = None
+
+
+def _use_shm_tmpdir() -> None:
+    """
+    Point TMPDIR at a fresh directory under /dev/shm for this session.
+    
+    tmp_path, tmp_path_factory and the tempfile module all read TMPDIR,
+    so the file I/O tests run in memory. Systems without a writable
+    /dev/shm are left alone. _restore_tmpdir() undoes the change.
+    """
+    global _saved_tmpdir
+    if not os.access('/dev/shm', os.W_OK):
+        return
+    
+    _saved_tmpdir = (os.environ.get('TMPDIR'), tempfile.tempdir)
+    os.environ['TMPDIR'] = tempfile.mkdtemp(prefix='tempdataset-tests-', dir='/dev/shm')
+    # tempfile caches the directory it picked on first use
+    tempfile.tempdir = None
+
+
+def _restore_tmpdir() -> None:
+    """Remove the /dev/shm directory and restore the previous TMPDIR."""
+    global _saved_tmpdir
+    if _saved_tmpdir is None:
+        return
+    
+    shutil.rmtree(os.environ['TMPDIR'], ignore_errors=True)
+    previous, tempfile.tempdir = _saved_tmpdir
+    if previous is None:
+        del os.environ['TMPDIR']
+    else:
+        os.environ['TMPDIR'] = previous
+    _saved_tmpdir = None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked slow (large row counts)"
+    )
+    parser.addoption(
+        "--shm-tmpdir", action="store_true", default=False,
+        help="keep temporary test files under /dev/shm (Linux)"
+    )
+
+
+def pytest_configure(config):
+    # pytest-xdist workers inherit TMPDIR from the controlling process
+    if config.getoption("--shm-tmpdir") and not hasattr(config, "workerinput"):
+        _use_shm_tmpdir()
+    
+    config.addinivalue_line("markers", "slow: large-rowcount tests, run only with --runslow")
+    
+    # pytest-xdist registers this marker itself; register it here too so
+    # the suite runs cleanly without the plugin installed
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep tests that share generated data on one pytest-xdist worker"
+    )
+
+
+def pytest_unconfigure(config):
+    _restore_tmpdir()
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="slow test, use --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def employees_data():
+    """
+    Seeded employee rows shared by tests that only check invariants.
+    
+    Generated once per session; tests slice off the rows they need.
+    Tests of seeding or fresh generation build their own dataset.
+    """
+    dataset = EmployeesDataset(rows=50)
+    dataset.set_seed(0)
+    return dataset.generate()
+
+
+@pytest.fixture(scope="session")
+def sales_df_factory():
+    """
+    Return a function that builds in-memory sales frames, cached by row count.
+    
+    Tests that ask for the same number of rows share one TempDataFrame, so
+    they must not modify it.
+    """
+    @lru_cache(maxsize=None)
+    def make_sales_df(rows: int):
+        return tempdataset.create_dataset('sales', rows=rows)
+    
+    return make_sales_df
@@ -11,7 +11,7 @@ import os
 import json
 import csv
 import re
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 
 # Import the library components
@@ -25,6 +25,34 @@ from tempdataset.core.exceptions import (
     JSONReadError, JSONWriteError
 )
 
+# ID, date and email formats checked on every generated row
+_ORDER_ID_RE = re.compile(r'^ORD-\d{4}-\d{6}$')
+_CUSTOMER_ID_RE = re.compile(r'^CUST-\d{4}$')
+_PRODUCT_ID_RE = re.compile(r'^PROD-[A-Z]{3}\d{3}$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+# Generated sales rows shared by the read-only generation and consistency tests
+@pytest.fixture(scope="session")
+def sales_3_rows():
+    return SalesDataset(rows=3).generate()
+
+
+@pytest.fixture(scope="session")
+def sales_5_rows():
+    return SalesDataset(rows=5).generate()
+
+
+@pytest.fixture(scope="session")
+def sales_10_rows():
+    return SalesDataset(rows=10).generate()
+
+
+@pytest.fixture(scope="session")
+def sales_20_rows():
+    return SalesDataset(rows=20).generate()
+
 
 class TestTempDataFrame:
     """Test TempDataFrame methods (head, tail, shape, columns, info)."""
@@ -441,12 +469,12 @@ class TestCSVIOOperations:
         assert error.filename == "nonexistent_file.csv"
         assert "not found" in str(error).lower()
     
-    def test_csv_read_malformed_file(self):
+    def test_csv_read_malformed_file(self, tmp_path):
         """Test CSV reading with malformed file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            # Write malformed CSV that will actually cause a parsing error
-            f.write('name,age,score\n"Alice"with"quotes,25,95.5\nBob,30,87.2\n')
-            temp_file = f.name
+        # Malformed CSV that may cause a parsing error
+        path = tmp_path / "malformed.csv"
+        path.write_text('name,age,score\n"Alice"with"quotes,25,95.5\nBob,30,87.2\n')
+        temp_file = str(path)
         
         try:
             # The CSV reader might handle some malformed files gracefully
@@ -454,30 +482,20 @@ class TestCSVIOOperations:
             result = read_csv(temp_file)
             # If it doesn't raise an error, that's also acceptable behavior
             assert isinstance(result, TempDataFrame)
-        except CSVReadError as exc_info:
+        except CSVReadError as error:
             # If it does raise an error, verify it's the right type
-            error = exc_info
             assert error.filename == temp_file
             assert "error" in str(error).lower() or "malformed" in str(error).lower()
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
     
-    def test_csv_read_empty_file(self):
+    def test_csv_read_empty_file(self, tmp_path):
         """Test CSV reading with empty file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            # Write just headers
-            f.write('name,age,score\n')
-            temp_file = f.name
+        # Just headers
+        path = tmp_path / "empty.csv"
+        path.write_text('name,age,score\n')
         
-        try:
-            df = read_csv(temp_file)
-            assert df.shape == (0, 3)  # No data rows, but 3 columns
-            assert df.columns == ["name", "age", "score"]
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-
+        df = read_csv(str(path))
+        assert df.shape == (0, 3)  # No data rows, but 3 columns
+        assert df.columns == ["name", "age", "score"]
 
 class TestJSONIOOperations:
     """Test JSON I/O operations."""
@@ -528,39 +546,29 @@ class TestJSONIOOperations:
         assert error.filename == "nonexistent_file.json"
         assert "not found" in str(error).lower()
     
-    def test_json_read_malformed_file(self):
+    def test_json_read_malformed_file(self, tmp_path):
         """Test JSON reading with malformed file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            # Write malformed JSON (trailing comma)
-            f.write('[{"name": "Alice", "age": 25,}]')
-            temp_file = f.name
+        # Malformed JSON (trailing comma)
+        path = tmp_path / "malformed.json"
+        path.write_text('[{"name": "Alice", "age": 25,}]')
         
-        try:
-            with pytest.raises(JSONReadError) as exc_info:
-                read_json(temp_file)
-            
-            error = exc_info.value
-            assert error.filename == temp_file
-            assert "json" in str(error).lower() or "decode" in str(error).lower()
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+        with pytest.raises(JSONReadError) as exc_info:
+            read_json(str(path))
+        
+        error = exc_info.value
+        assert error.filename == str(path)
+        assert "json" in str(error).lower() or "decode" in str(error).lower()
     
-    def test_json_read_empty_array(self):
+    def test_json_read_empty_array(self, tmp_path):
         """Test JSON reading with empty array."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('[]')
-            temp_file = f.name
+        path = tmp_path / "empty.json"
+        path.write_text('[]')
         
-        try:
-            df = read_json(temp_file)
-            assert df.shape == (0, 0)  # No data rows, no columns
-            assert df.columns == []
-        finally:
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
-
+        df = read_json(str(path))
+        assert df.shape == (0, 0)  # No data rows, no columns
+        assert df.columns == []
 
+@pytest.mark.xdist_group(name="sales")
 class TestSalesDatasetGeneration:
     """Test SalesDataset generation with all required columns and data types."""
     
@@ -608,10 +616,9 @@ class TestSalesDatasetGeneration:
             data = dataset.generate()
             assert len(data) == row_count
     
-    def test_sales_dataset_generation_columns(self):
+    def test_sales_dataset_generation_columns(self, sales_5_rows):
         """Test SalesDataset generates all required columns."""
-        dataset = SalesDataset(rows=5)
-        data = dataset.generate()
+        data = sales_5_rows
         
         expected_columns = [
             'order_id', 'customer_id', 'customer_name', 'customer_email',
@@ -628,30 +635,23 @@ class TestSalesDatasetGeneration:
             for col in expected_columns:
                 assert col in row
     
-    def test_sales_dataset_id_formats(self):
+    def test_sales_dataset_id_formats(self, sales_3_rows):
         """Test SalesDataset ID format validation."""
-        dataset = SalesDataset(rows=3)
-        data = dataset.generate()
-        
-        import re
+        data = sales_3_rows
         
         for row in data:
             # Test order_id format: ORD-YYYY-NNNNNN
-            order_id_pattern = r'^ORD-\d{4}-\d{6}$'
-            assert re.match(order_id_pattern, row['order_id']), f"Invalid order_id format: {row['order_id']}"
+            assert _ORDER_ID_RE.match(row['order_id']), f"Invalid order_id format: {row['order_id']}"
             
             # Test customer_id format: CUST-NNNN
-            customer_id_pattern = r'^CUST-\d{4}$'
-            assert re.match(customer_id_pattern, row['customer_id']), f"Invalid customer_id format: {row['customer_id']}"
+            assert _CUSTOMER_ID_RE.match(row['customer_id']), f"Invalid customer_id format: {row['customer_id']}"
             
             # Test product_id format: PROD-AAANNN
-            product_id_pattern = r'^PROD-[A-Z]{3}\d{3}$'
-            assert re.match(product_id_pattern, row['product_id']), f"Invalid product_id format: {row['product_id']}"
+            assert _PRODUCT_ID_RE.match(row['product_id']), f"Invalid product_id format: {row['product_id']}"
     
-    def test_sales_dataset_data_types(self):
+    def test_sales_dataset_data_types(self, sales_5_rows):
         """Test SalesDataset generates correct data types."""
-        dataset = SalesDataset(rows=5)
-        data = dataset.generate()
+        data = sales_5_rows
         
         for row in data:
             # String fields
@@ -693,19 +693,18 @@ class TestSalesDatasetGeneration:
             assert isinstance(row['delivery_date'], str)
             
             # Validate date format
-            date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-            assert re.match(date_pattern, row['order_date'])
-            assert re.match(date_pattern, row['ship_date'])
-            assert re.match(date_pattern, row['delivery_date'])
+            assert _DATE_RE.match(row['order_date'])
+            assert _DATE_RE.match(row['ship_date'])
+            assert _DATE_RE.match(row['delivery_date'])
 
 
+@pytest.mark.xdist_group(name="sales")
 class TestDataConsistencyValidation:
     """Test data consistency and relationship validation."""
     
-    def test_sales_calculations_consistency(self):
+    def test_sales_calculations_consistency(self, sales_10_rows):
         """Test that sales calculations are mathematically consistent."""
-        dataset = SalesDataset(rows=10)
-        data = dataset.generate()
+        data = sales_10_rows
         
         for row in data:
             # Test total_price = quantity × unit_price (allow for floating point precision)
@@ -723,15 +722,14 @@ class TestDataConsistencyValidation:
             assert 0.10 <= profit_percentage <= 0.30, \
                 f"profit percentage out of range: {profit_percentage:.2%}"
     
-    def test_date_relationships_consistency(self):
+    def test_date_relationships_consistency(self, sales_10_rows):
         """Test that date relationships are logically consistent."""
-        dataset = SalesDataset(rows=10)
-        data = dataset.generate()
+        data = sales_10_rows
         
         for row in data:
-            order_date = datetime.strptime(row['order_date'], '%Y-%m-%d')
-            ship_date = datetime.strptime(row['ship_date'], '%Y-%m-%d')
-            delivery_date = datetime.strptime(row['delivery_date'], '%Y-%m-%d')
+            order_date = date.fromisoformat(row['order_date'])
+            ship_date = date.fromisoformat(row['ship_date'])
+            delivery_date = date.fromisoformat(row['delivery_date'])
             
             # Test order_date < ship_date < delivery_date
             assert order_date < ship_date, \
@@ -754,14 +752,18 @@ class TestDataConsistencyValidation:
         dataset = SalesDataset(rows=20)
         data = dataset.generate()
         
-        # Get expected values from dataset
-        expected_regions = dataset.regions
-        expected_segments = dataset.customer_segments
-        expected_priorities = dataset.order_priorities
-        expected_shipping_modes = dataset.shipping_modes
-        expected_payment_methods = dataset.payment_methods
-        expected_genders = dataset.genders
-        expected_categories = list(dataset.categories.keys())
+        # Get expected values from dataset as sets for hashed lookups
+        expected_regions = frozenset(dataset.regions)
+        expected_segments = frozenset(dataset.customer_segments)
+        expected_priorities = frozenset(dataset.order_priorities)
+        expected_shipping_modes = frozenset(dataset.shipping_modes)
+        expected_payment_methods = frozenset(dataset.payment_methods)
+        expected_genders = frozenset(dataset.genders)
+        expected_categories = frozenset(dataset.categories)
+        expected_subcategories_by_category = {
+            category: frozenset(subcategories)
+            for category, subcategories in dataset.categories.items()
+        }
         
         for row in data:
             # Test region values
@@ -793,53 +795,41 @@ class TestDataConsistencyValidation:
                 f"Invalid category: {row['category']}"
             
             # Test subcategory is valid for the category
-            expected_subcategories = dataset.categories[row['category']]
+            expected_subcategories = expected_subcategories_by_category[row['category']]
             assert row['subcategory'] in expected_subcategories, \
                 f"Invalid subcategory '{row['subcategory']}' for category '{row['category']}'"
     
-    def test_numeric_ranges_consistency(self):
+    # Prices are rounded to cents, so "positive" means at least 0.01
+    @pytest.mark.parametrize("field,lo,hi", [
+        ("quantity", 1, 10),
+        ("customer_age", 18, 80),
+        ("unit_price", 0.01, None),
+        ("discount", 0, None),
+        ("final_price", 0.01, None),
+        ("profit", 0.01, None),
+    ])
+    def test_numeric_ranges_consistency(self, sales_20_rows, field, lo, hi):
         """Test that numeric values are within reasonable ranges."""
-        dataset = SalesDataset(rows=20)
-        data = dataset.generate()
+        values = [row[field] for row in sales_20_rows]
         
-        for row in data:
-            # Test quantity range (1-10)
-            assert 1 <= row['quantity'] <= 10, \
-                f"quantity out of range: {row['quantity']}"
-            
-            # Test customer age range (18-80)
-            assert 18 <= row['customer_age'] <= 80, \
-                f"customer_age out of range: {row['customer_age']}"
-            
-            # Test unit_price is positive
-            assert row['unit_price'] > 0, \
-                f"unit_price should be positive: {row['unit_price']}"
-            
-            # Test discount is non-negative and reasonable (0-20% of total_price)
-            assert row['discount'] >= 0, \
-                f"discount should be non-negative: {row['discount']}"
-            assert row['discount'] <= row['total_price'] * 0.20, \
-                f"discount too high: {row['discount']} > 20% of {row['total_price']}"
-            
-            # Test final_price is positive
-            assert row['final_price'] > 0, \
-                f"final_price should be positive: {row['final_price']}"
-            
-            # Test profit is positive
-            assert row['profit'] > 0, \
-                f"profit should be positive: {row['profit']}"
+        assert min(values) >= lo, f"{field} below {lo}: {min(values)}"
+        if hi is not None:
+            assert max(values) <= hi, f"{field} above {hi}: {max(values)}"
+    
+    def test_discount_within_limit(self, sales_20_rows):
+        """Test that discounts are at most 20% of total_price."""
+        too_high = [
+            (row['discount'], row['total_price']) for row in sales_20_rows
+            if row['discount'] > row['total_price'] * 0.20
+        ]
+        assert not too_high, f"discount above 20% of total_price: {too_high}"
     
-    def test_email_format_consistency(self):
+    def test_email_format_consistency(self, sales_10_rows):
         """Test that email addresses have valid format."""
-        dataset = SalesDataset(rows=10)
-        data = dataset.generate()
-        
-        import re
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        data = sales_10_rows
         
-        for row in data:
-            assert re.match(email_pattern, row['customer_email']), \
-                f"Invalid email format: {row['customer_email']}"
+        invalid = [row['customer_email'] for row in data if not _EMAIL_RE.match(row['customer_email'])]
+        assert not invalid, f"Invalid email format: {invalid}"
     
     def test_reproducibility_with_seed(self):
         """Test that setting seed produces reproducible results."""
@@ -852,12 +842,8 @@ class TestDataConsistencyValidation:
         dataset2.set_seed(42)
         data2 = dataset2.generate()
         
-        # Data should be identical
-        assert len(data1) == len(data2)
-        for i in range(len(data1)):
-            for key in data1[i]:
-                assert data1[i][key] == data2[i][key], \
-                    f"Mismatch at row {i}, key {key}: {data1[i][key]} != {data2[i][key]}"
+        # Data should be identical; pytest reports the first differing row
+        assert data1 == data2
 
 
 if __name__ == "__main__":
@@ -31,7 +31,7 @@ class TestEcommerceDataset(unittest.TestCase):
         dataset = EcommerceDataset()
         schema = dataset.get_schema()
         
-        # Check that all required columns are present
+        # Check that exactly the required columns are present
         required_columns = [
             'transaction_id', 'customer_id', 'customer_name', 'customer_email',
             'product_id', 'product_name', 'category', 'subcategory', 'brand',
@@ -43,8 +43,7 @@ class TestEcommerceDataset(unittest.TestCase):
             'return_reason', 'seller_id', 'seller_name', 'profit'
         ]
         
-        for column in required_columns:
-            self.assertIn(column, schema)
+        self.assertEqual(set(required_columns), set(schema))
     
     def test_ecommerce_data_consistency(self):
         """Test data consistency and calculations."""
@@ -52,23 +51,35 @@ class TestEcommerceDataset(unittest.TestCase):
         dataset.set_seed(42)
         data = dataset.generate()
         
-        for row in data:
-            # Test price calculations
-            expected_total = row['unit_price'] * row['quantity']
-            self.assertAlmostEqual(row['total_price'], expected_total, places=1)
-            
-            expected_discount = (row['total_price'] * row['discount_percentage']) / 100
-            self.assertAlmostEqual(row['discount_amount'], expected_discount, places=1)
-            
-            expected_final = row['total_price'] - row['discount_amount']
-            self.assertAlmostEqual(row['final_price'], expected_final, places=1)
-            
-            # Test data types
-            self.assertIsInstance(row['transaction_id'], str)
-            self.assertIsInstance(row['customer_id'], str)
-            self.assertIsInstance(row['quantity'], int)
-            self.assertIsInstance(row['unit_price'], float)
-            self.assertIsInstance(row['return_requested'], bool)
+        # Test price calculations, collecting the rows that are off by 0.05
+        # or more (assertAlmostEqual with places=1) for one assertion each
+        bad_totals = [
+            i for i, row in enumerate(data)
+            if round(row['total_price'] - row['unit_price'] * row['quantity'], 1) != 0
+        ]
+        self.assertEqual(bad_totals, [], "total_price != unit_price * quantity")
+        
+        bad_discounts = [
+            i for i, row in enumerate(data)
+            if round(row['discount_amount'] - row['total_price'] * row['discount_percentage'] / 100, 1) != 0
+        ]
+        self.assertEqual(bad_discounts, [], "discount_amount != total_price * discount_percentage / 100")
+        
+        bad_finals = [
+            i for i, row in enumerate(data)
+            if round(row['final_price'] - (row['total_price'] - row['discount_amount']), 1) != 0
+        ]
+        self.assertEqual(bad_finals, [], "final_price != total_price - discount_amount")
+        
+        # Test data types with exact type checks in a single pass
+        self.assertTrue(all(
+            type(row['transaction_id']) is str
+            and type(row['customer_id']) is str
+            and type(row['quantity']) is int
+            and type(row['unit_price']) is float
+            and type(row['return_requested']) is bool
+            for row in data
+        ), "Unexpected column types in generated rows")
     
     def test_ecommerce_tempdataset_integration(self):
         """Test integration with tempdataset function."""
@@ -79,17 +90,15 @@ class TestEcommerceDataset(unittest.TestCase):
     
     def test_ecommerce_file_export(self):
         """Test file export functionality."""
+        # Generate once and write the same frame in each format
+        data = tempdataset('ecommerce', rows=5)
+        
         with tempfile.TemporaryDirectory() as temp_dir:
-            csv_file = os.path.join(temp_dir, 'test_ecommerce.csv')
-            json_file = os.path.join(temp_dir, 'test_ecommerce.json')
-            
-            # Test CSV export
-            tempdataset(csv_file, rows=5)
-            self.assertTrue(os.path.exists(csv_file))
-            
-            # Test JSON export
-            tempdataset(json_file, rows=5)
-            self.assertTrue(os.path.exists(json_file))
+            for ext, export in (('csv', data.to_csv), ('json', data.to_json)):
+                with self.subTest(format=ext):
+                    filename = os.path.join(temp_dir, 'test_ecommerce.' + ext)
+                    export(filename)
+                    self.assertTrue(os.path.exists(filename))
     
     def test_ecommerce_data_ranges(self):
         """Test that generated data falls within expected ranges."""
@@ -97,26 +106,21 @@ class TestEcommerceDataset(unittest.TestCase):
         dataset.set_seed(42)
         data = dataset.generate()
         
-        for row in data:
-            # Test quantity range
-            self.assertGreaterEqual(row['quantity'], 1)
-            self.assertLessEqual(row['quantity'], 10)
-            
-            # Test discount percentage range
-            self.assertGreaterEqual(row['discount_percentage'], 0)
-            self.assertLessEqual(row['discount_percentage'], 50)
-            
-            # Test unit price is positive
-            self.assertGreater(row['unit_price'], 0)
-            
-            # Test profit is positive
-            self.assertGreater(row['profit'], 0)
-            
-            # Test review rating range (if present)
-            if row['review_rating'] is not None:
-                self.assertGreaterEqual(row['review_rating'], 1)
-                self.assertLessEqual(row['review_rating'], 5)
-
+        # Prices are rounded to cents, so "positive" means at least 0.01
+        ranges = [
+            ('quantity', 1, 10),
+            ('discount_percentage', 0, 50),
+            ('unit_price', 0.01, None),
+            ('profit', 0.01, None),
+            ('review_rating', 1, 5),
+        ]
+        for field, lo, hi in ranges:
+            with self.subTest(field=field):
+                # review_rating is optional, so missing values are skipped
+                values = [row[field] for row in data if row[field] is not None]
+                self.assertGreaterEqual(min(values, default=lo), lo)
+                if hi is not None:
+                    self.assertLessEqual(max(values, default=hi), hi)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,11 +5,30 @@ Tests the EmployeesDataset class functionality including data generation,
 validation, and schema compliance.
 """
 
+import operator
 import pytest
-from datetime import datetime
+from datetime import date
 from tempdataset.core.datasets.employees import EmployeesDataset
 
+# Columns every employees row and the schema must contain
+EMPLOYEE_COLUMNS = frozenset([
+    'employee_id', 'first_name', 'last_name', 'full_name', 'gender',
+    'date_of_birth', 'age', 'email', 'phone_number', 'address',
+    'city', 'state_province', 'country', 'postal_code', 'department',
+    'job_title', 'employment_type', 'hire_date', 'termination_date',
+    'years_with_company', 'manager_id', 'manager_name', 'salary_usd',
+    'bonus_usd', 'total_compensation_usd', 'performance_score',
+    'last_performance_review_date', 'training_hours', 'skills',
+    'certifications', 'projects_count', 'current_project',
+    'leave_balance_days', 'work_location', 'office_location',
+    'employee_status'
+])
 
+# Statuses that require a termination date
+TERMINAL_STATUSES = frozenset(['Terminated', 'Retired'])
+
+
+@pytest.mark.xdist_group(name="employees")
 class TestEmployeesDataset:
     """Test cases for EmployeesDataset class."""
     
@@ -29,40 +48,28 @@ class TestEmployeesDataset:
         assert len(data) == 10
         assert all(isinstance(row, dict) for row in data)
     
-    def test_employees_dataset_required_columns(self):
+    def test_employees_dataset_required_columns(self, employees_data):
         """Test that all required columns are present."""
-        dataset = EmployeesDataset(rows=5)
-        data = dataset.generate()
-        
-        required_columns = [
-            'employee_id', 'first_name', 'last_name', 'full_name', 'gender',
-            'date_of_birth', 'age', 'email', 'phone_number', 'address',
-            'city', 'state_province', 'country', 'postal_code', 'department',
-            'job_title', 'employment_type', 'hire_date', 'termination_date',
-            'years_with_company', 'manager_id', 'manager_name', 'salary_usd',
-            'bonus_usd', 'total_compensation_usd', 'performance_score',
-            'last_performance_review_date', 'training_hours', 'skills',
-            'certifications', 'projects_count', 'current_project',
-            'leave_balance_days', 'work_location', 'office_location',
-            'employee_status'
-        ]
+        data = employees_data[:5]
         
         for row in data:
-            for column in required_columns:
-                assert column in row, f"Missing column: {column}"
+            missing = EMPLOYEE_COLUMNS - row.keys()
+            assert not missing, f"Missing columns: {sorted(missing)}"
     
-    def test_employees_dataset_unique_ids(self):
+    def test_employees_dataset_unique_ids(self, employees_data):
         """Test that employee IDs are unique."""
-        dataset = EmployeesDataset(rows=50)
-        data = dataset.generate()
+        data = employees_data
         
-        employee_ids = [row['employee_id'] for row in data]
-        assert len(employee_ids) == len(set(employee_ids)), "Employee IDs are not unique"
+        # Stop at the first duplicate and report it
+        seen = set()
+        for row in data:
+            employee_id = row['employee_id']
+            assert employee_id not in seen, f"Duplicate employee ID: {employee_id}"
+            seen.add(employee_id)
     
-    def test_employees_dataset_id_format(self):
+    def test_employees_dataset_id_format(self, employees_data):
         """Test that employee IDs follow the correct format."""
-        dataset = EmployeesDataset(rows=10)
-        data = dataset.generate()
+        data = employees_data[:10]
         
         for row in data:
             employee_id = row['employee_id']
@@ -70,10 +77,9 @@ class TestEmployeesDataset:
             assert len(employee_id) == 10, f"Invalid employee ID length: {employee_id}"
             assert employee_id[4:].isdigit(), f"Invalid employee ID format: {employee_id}"
     
-    def test_employees_dataset_data_types(self):
+    def test_employees_dataset_data_types(self, employees_data):
         """Test that data types are correct."""
-        dataset = EmployeesDataset(rows=5)
-        data = dataset.generate()
+        data = employees_data[:5]
         
         for row in data:
             # String fields
@@ -110,49 +116,53 @@ class TestEmployeesDataset:
             assert row['certifications'] is None or isinstance(row['certifications'], str)
             assert row['current_project'] is None or isinstance(row['current_project'], str)
     
-    def test_employees_dataset_date_logic(self):
+    def test_employees_dataset_date_logic(self, employees_data):
         """Test that date relationships are logical."""
-        dataset = EmployeesDataset(rows=20)
-        data = dataset.generate()
+        data = employees_data[:20]
         
-        for row in data:
-            hire_date = datetime.strptime(row['hire_date'], '%Y-%m-%d')
-            birth_date = datetime.strptime(row['date_of_birth'], '%Y-%m-%d')
-            review_date = datetime.strptime(row['last_performance_review_date'], '%Y-%m-%d')
-            
-            # Birth date should be before hire date
-            assert birth_date < hire_date, "Birth date should be before hire date"
-            
-            # Review date should be after hire date
-            assert review_date >= hire_date, "Review date should be after hire date"
-            
-            # If terminated, termination date should be after hire date
-            if row['termination_date']:
-                term_date = datetime.strptime(row['termination_date'], '%Y-%m-%d')
-                assert term_date >= hire_date, "Termination date should be after hire date"
+        # Parse each date column in one pass
+        hire_dates = [date.fromisoformat(row['hire_date']) for row in data]
+        birth_dates = [date.fromisoformat(row['date_of_birth']) for row in data]
+        review_dates = [date.fromisoformat(row['last_performance_review_date']) for row in data]
+        term_dates = [
+            date.fromisoformat(row['termination_date']) if row['termination_date'] else None
+            for row in data
+        ]
+        
+        # Birth date should be before hire date
+        assert all(map(operator.lt, birth_dates, hire_dates)), "Birth date should be before hire date"
+        
+        # Review date should be after hire date
+        assert all(map(operator.ge, review_dates, hire_dates)), "Review date should be after hire date"
+        
+        # If terminated, termination date should be after hire date
+        assert all(term is None or term >= hire for term, hire in zip(term_dates, hire_dates)), \
+            "Termination date should be after hire date"
     
-    def test_employees_dataset_compensation_logic(self):
+    def test_employees_dataset_compensation_logic(self, employees_data):
         """Test that compensation calculations are correct."""
-        dataset = EmployeesDataset(rows=10)
-        data = dataset.generate()
+        data = employees_data[:10]
         
-        for row in data:
-            salary = row['salary_usd']
-            bonus = row['bonus_usd']
-            total = row['total_compensation_usd']
-            
-            # Total compensation should equal salary + bonus
-            assert abs(total - (salary + bonus)) < 0.01, "Total compensation calculation is incorrect"
-            
-            # All compensation values should be positive
-            assert salary > 0, "Salary should be positive"
-            assert bonus >= 0, "Bonus should be non-negative"
-            assert total > 0, "Total compensation should be positive"
+        salaries = [row['salary_usd'] for row in data]
+        bonuses = [row['bonus_usd'] for row in data]
+        totals = [row['total_compensation_usd'] for row in data]
+        
+        # Total compensation should equal salary + bonus
+        bad_totals = [
+            (total, salary, bonus)
+            for total, salary, bonus in zip(totals, salaries, bonuses)
+            if abs(total - (salary + bonus)) >= 0.01
+        ]
+        assert not bad_totals, f"Total compensation calculation is incorrect: {bad_totals}"
+        
+        # All compensation values should be positive
+        assert min(salaries) > 0, "Salary should be positive"
+        assert min(bonuses) >= 0, "Bonus should be non-negative"
+        assert min(totals) > 0, "Total compensation should be positive"
     
-    def test_employees_dataset_departments_and_titles(self):
+    def test_employees_dataset_departments_and_titles(self, employees_data):
         """Test that departments and job titles are consistent."""
-        dataset = EmployeesDataset(rows=30)
-        data = dataset.generate()
+        data = employees_data[:30]
         
         valid_departments = ['HR', 'Sales', 'Marketing', 'IT', 'Finance', 'Operations', 'R&D', 'Customer Support']
         
@@ -163,46 +173,40 @@ class TestEmployeesDataset:
             assert department in valid_departments, f"Invalid department: {department}"
             assert isinstance(job_title, str) and len(job_title) > 0, "Job title should be a non-empty string"
     
-    def test_employees_dataset_manager_relationships(self):
+    def test_employees_dataset_manager_relationships(self, employees_data):
         """Test that manager relationships are logical."""
-        dataset = EmployeesDataset(rows=50)
-        data = dataset.generate()
+        data = employees_data
         
         # Collect all employee IDs and names
         employee_ids = {row['employee_id']: row['full_name'] for row in data}
         
-        for row in data:
-            manager_id = row['manager_id']
-            manager_name = row['manager_name']
-            
-            if manager_id is not None:
-                # Manager ID should exist in the dataset
-                assert manager_id in employee_ids, f"Manager ID {manager_id} not found in dataset"
-                
-                # Manager name should match the manager ID
-                assert manager_name == employee_ids[manager_id], "Manager name doesn't match manager ID"
-                
-                # Employee shouldn't be their own manager
-                assert manager_id != row['employee_id'], "Employee cannot be their own manager"
+        # A manager must exist, match the recorded name and not be the employee
+        bad = [
+            (row['employee_id'], row['manager_id']) for row in data
+            if row['manager_id'] is not None and (
+                row['manager_id'] not in employee_ids
+                or employee_ids[row['manager_id']] != row['manager_name']
+                or row['manager_id'] == row['employee_id']
+            )
+        ]
+        assert not bad, f"Invalid manager relationships (employee, manager): {bad[:5]}"
     
-    def test_employees_dataset_performance_scores(self):
+    def test_employees_dataset_performance_scores(self, employees_data):
         """Test that performance scores are within valid range."""
-        dataset = EmployeesDataset(rows=20)
-        data = dataset.generate()
+        data = employees_data[:20]
         
         for row in data:
             score = row['performance_score']
             assert 1 <= score <= 5, f"Performance score {score} is not in valid range 1-5"
     
-    def test_employees_dataset_age_calculation(self):
+    def test_employees_dataset_age_calculation(self, employees_data):
         """Test that age is calculated correctly from birth date."""
-        dataset = EmployeesDataset(rows=10)
-        data = dataset.generate()
+        data = employees_data[:10]
         
-        today = datetime.now()
+        today = date.today()
         
         for row in data:
-            birth_date = datetime.strptime(row['date_of_birth'], '%Y-%m-%d')
+            birth_date = date.fromisoformat(row['date_of_birth'])
             calculated_age = int((today - birth_date).days / 365.25)
             
             # Age should be within 1 year of calculated age (accounting for leap years)
@@ -213,22 +217,7 @@ class TestEmployeesDataset:
         dataset = EmployeesDataset()
         schema = dataset.get_schema()
         
-        expected_columns = [
-            'employee_id', 'first_name', 'last_name', 'full_name', 'gender',
-            'date_of_birth', 'age', 'email', 'phone_number', 'address',
-            'city', 'state_province', 'country', 'postal_code', 'department',
-            'job_title', 'employment_type', 'hire_date', 'termination_date',
-            'years_with_company', 'manager_id', 'manager_name', 'salary_usd',
-            'bonus_usd', 'total_compensation_usd', 'performance_score',
-            'last_performance_review_date', 'training_hours', 'skills',
-            'certifications', 'projects_count', 'current_project',
-            'leave_balance_days', 'work_location', 'office_location',
-            'employee_status'
-        ]
-        
-        assert len(schema) == len(expected_columns)
-        for column in expected_columns:
-            assert column in schema, f"Missing column in schema: {column}"
+        assert set(schema) == EMPLOYEE_COLUMNS
     
     def test_employees_dataset_reproducibility(self):
         """Test that setting a seed produces reproducible results."""
@@ -241,15 +230,11 @@ class TestEmployeesDataset:
         data2 = dataset2.generate()
         
         # Data should be identical when using the same seed
-        assert len(data1) == len(data2)
-        for i in range(len(data1)):
-            for key in data1[i]:
-                assert data1[i][key] == data2[i][key], f"Data mismatch at row {i}, column {key}"
+        assert data1 == data2
     
-    def test_employees_dataset_skills_format(self):
+    def test_employees_dataset_skills_format(self, employees_data):
         """Test that skills are properly formatted."""
-        dataset = EmployeesDataset(rows=10)
-        data = dataset.generate()
+        data = employees_data[:10]
         
         for row in data:
             skills = row['skills']
@@ -261,19 +246,12 @@ class TestEmployeesDataset:
             assert len(skill_list) >= 1, "Should have at least one skill"
             assert all(len(skill) > 0 for skill in skill_list), "All skills should be non-empty"
     
-    def test_employees_dataset_employment_status_logic(self):
+    def test_employees_dataset_employment_status_logic(self, employees_data):
         """Test that employment status is consistent with termination date."""
-        dataset = EmployeesDataset(rows=30)
-        data = dataset.generate()
+        data = employees_data[:30]
         
-        for row in data:
-            status = row['employee_status']
-            termination_date = row['termination_date']
-            
-            if status in ['Terminated', 'Retired']:
-                # Should have termination date
-                assert termination_date is not None, f"Employee with status {status} should have termination date"
-            elif status == 'Active':
-                # Should not have termination date (or it could be None)
-                # Note: Some active employees might have termination_date as None, which is correct
-                pass
\ No newline at end of file
+        missing = [
+            (row['employee_id'], row['employee_status']) for row in data
+            if row['employee_status'] in TERMINAL_STATUSES and row['termination_date'] is None
+        ]
+        assert not missing, f"Employees without a termination date: {missing[:3]}"
\ No newline at end of file
@@ -106,10 +106,10 @@ class TestEndToEndDatasetGeneration:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
     
-    def test_dataset_generation_memory_workflow(self):
+    def test_dataset_generation_memory_workflow(self, sales_df_factory):
         """Test complete workflow: generate dataset -> return TempDataFrame -> verify data."""
         # Generate dataset in memory
-        df = tempdataset.create_dataset('sales', rows=20)
+        df = sales_df_factory(20)
         
         # Verify return type
         assert isinstance(df, TempDataFrame)
@@ -142,12 +142,12 @@ class TestEndToEndDatasetGeneration:
         assert "20 entries" in info_str
         assert "30 columns" in info_str
     
-    def test_different_row_counts_workflow(self):
+    def test_different_row_counts_workflow(self, sales_df_factory):
         """Test workflow with different row counts."""
         test_counts = [1, 5, 50, 100]
         
         for count in test_counts:
-            df = tempdataset.create_dataset('sales', rows=count)
+            df = sales_df_factory(count)
             assert isinstance(df, TempDataFrame)
             assert df.shape[0] == count
             assert df.shape[1] == 30  # Column count should be consistent
@@ -161,10 +161,10 @@ class TestEndToEndDatasetGeneration:
 class TestFileRoundTripIntegrity:
     """Test reading generated files back into TempDataFrame and verify data integrity."""
     
-    def test_csv_roundtrip_integrity(self):
+    def test_csv_roundtrip_integrity(self, sales_df_factory):
         """Test CSV save/load cycle maintains data integrity."""
         # Generate original dataset
-        original_df = tempdataset.create_dataset('sales', rows=10)
+        original_df = sales_df_factory(10)
         
         with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
             temp_file = f.name
@@ -200,10 +200,10 @@ class TestFileRoundTripIntegrity:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
     
-    def test_json_roundtrip_integrity(self):
+    def test_json_roundtrip_integrity(self, sales_df_factory):
         """Test JSON save/load cycle maintains data integrity."""
         # Generate original dataset
-        original_df = tempdataset.create_dataset('sales', rows=8)
+        original_df = sales_df_factory(8)
         
         with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
             temp_file = f.name
@@ -244,10 +244,10 @@ class TestFileRoundTripIntegrity:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
     
-    def test_multiple_save_load_cycles(self):
+    def test_multiple_save_load_cycles(self, sales_df_factory):
         """Test multiple save/load cycles don't degrade data."""
         # Start with original dataset
-        df = tempdataset.create_dataset('sales', rows=5)
+        df = sales_df_factory(5)
         original_data = df._data.copy()
         
         # Perform multiple JSON save/load cycles
@@ -275,7 +275,7 @@ class TestFileRoundTripIntegrity:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
     
-    def test_direct_file_generation_vs_memory_generation(self):
+    def test_direct_file_generation_vs_memory_generation(self, sales_df_factory):
         """Test that direct file generation produces same data as memory generation."""
         with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
             temp_file = f.name
@@ -288,7 +288,7 @@ class TestFileRoundTripIntegrity:
             file_df = tempdataset.read_json(temp_file)
             
             # Generate equivalent dataset in memory
-            memory_df = tempdataset.create_dataset('sales', rows=10)
+            memory_df = sales_df_factory(10)
             
             # Both should have same structure
             assert file_df.shape == memory_df.shape
@@ -430,10 +430,10 @@ class TestErrorScenariosAndRecovery:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
     
-    def test_large_dataset_handling(self):
+    def test_large_dataset_handling(self, sales_df_factory):
         """Test handling of reasonably large datasets."""
         # Test with a moderately large dataset (not too large to avoid memory issues)
-        df = tempdataset.create_dataset('sales', rows=1000)
+        df = sales_df_factory(1000)
         
         assert isinstance(df, TempDataFrame)
         assert df.shape == (1000, 30)
@@ -471,10 +471,10 @@ class TestErrorScenariosAndRecovery:
 class TestCrossFormatCompatibility:
     """Test compatibility between different file formats."""
     
-    def test_csv_to_json_conversion(self):
+    def test_csv_to_json_conversion(self, sales_df_factory):
         """Test converting data from CSV to JSON format."""
         # Generate dataset and save as CSV
-        original_df = tempdataset.create_dataset('sales', rows=5)
+        original_df = sales_df_factory(5)
         
         with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as f:
             csv_file = f.name
@@ -514,10 +514,10 @@ class TestCrossFormatCompatibility:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
     
-    def test_json_to_csv_conversion(self):
+    def test_json_to_csv_conversion(self, sales_df_factory):
         """Test converting data from JSON to CSV format."""
         # Generate dataset and save as JSON
-        original_df = tempdataset.create_dataset('sales', rows=5)
+        original_df = sales_df_factory(5)
         
         with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
             json_file = f.name
@@ -10,15 +10,18 @@ import tempfile
 import os
 import json
 import re
-from datetime import datetime
+from datetime import date
 
 # Import the library components
 import tempdataset
 from tempdataset.core.utils.data_frame import TempDataFrame
 from tempdataset.core.datasets.sales import SalesDataset
 from tempdataset.core.io.csv_handler import read_csv
-from tempdataset.core.io.json_handler import read_json
-from tempdataset.core.exceptions import ValidationError
+from tempdataset.core.io.json_handler import read_json, write_json
+from tempdataset.core.exceptions import ValidationError, TempDatasetError, JSONWriteError
+
+# Email format checked on every generated row
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 class TestTempDataFrameBasics:
@@ -91,6 +94,42 @@ class TestTempDataFrameBasics:
         assert df.tail() == "Empty DataFrame"
         assert df.info() == "Empty DataFrame"
 
+    def test_length_follows_row_list(self):
+        """Test that rows appended to the backing list are counted."""
+        data = []
+        df = TempDataFrame(data, ["name"])
+        data.append({"name": "Alice"})
+
+        assert len(df) == 1
+        assert df.shape == (1, 1)
+        assert "Alice" in str(df.head())
+
+    def test_from_columns(self):
+        """Test building a TempDataFrame from column lists."""
+        df = TempDataFrame.from_columns(
+            {"name": ["Alice", "Bob", "Charlie"], "age": [25, 30, 35]},
+            ["name", "age"]
+        )
+
+        assert df.shape == (3, 2)
+        assert len(df) == 3
+        assert list(df) == [
+            {"name": "Alice", "age": 25},
+            {"name": "Bob", "age": 30},
+            {"name": "Charlie", "age": 35}
+        ]
+        assert df._data[1] == {"name": "Bob", "age": 30}
+        assert "Charlie" in str(df.tail(1))
+        assert "Charlie" not in str(df.head(2))
+
+        selected = df.select(["age"])
+        assert selected.to_dict() == [{"age": 25}, {"age": 30}, {"age": 35}]
+
+    def test_from_columns_unequal_lengths(self):
+        """Test that column lists must all have the same length."""
+        with pytest.raises(ValidationError):
+            TempDataFrame.from_columns({"a": [1, 2], "b": [1]})
+
 
 class TestTempDataFrameFileIO:
     """Test TempDataFrame file I/O operations."""
@@ -121,6 +160,74 @@ class TestTempDataFrameFileIO:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
     
+    def test_csv_import_skips_blank_lines(self, tmp_path):
+        """Test blank lines before the header and between rows are skipped."""
+        temp_file = tmp_path / "blank.csv"
+        temp_file.write_text("\n\nname,age\nAlice,25\n\nBob,30\n", encoding='utf-8')
+        
+        df = read_csv(str(temp_file))
+        assert df.columns == ["name", "age"]
+        assert df.to_dict() == [{"name": "Alice", "age": "25"}, {"name": "Bob", "age": "30"}]
+    
+    def test_csv_read_share_strings(self, tmp_path):
+        """Test share_strings makes repeated values share one string object."""
+        temp_file = tmp_path / "data.csv"
+        temp_file.write_text("id,status\n" + "".join(f"{i},active\n" for i in range(100)), encoding='utf-8')
+
+        plain = read_csv(str(temp_file))
+        shared = read_csv(str(temp_file), share_strings=True)
+        assert shared.to_dict() == plain.to_dict()
+
+        statuses = shared._column_values("status")
+        assert all(value is statuses[0] for value in statuses)
+
+    @pytest.mark.parametrize("city", ["Boston", "Boston, MA"])
+    def test_csv_writer_matches_csv_module(self, tmp_path, city):
+        """Test the joined-text CSV path writes what csv.writer would."""
+        import csv
+        import io
+        columns = ["name", "age", "score", "active", "city"]
+        column_data = {
+            "name": ["Alice", "Bob"],
+            "age": [25, 30],
+            "score": [95.5, 87.2],
+            "active": [True, False],
+            "city": [city, "Chicago"],
+        }
+        temp_file = str(tmp_path / "out.csv")
+        TempDataFrame.from_columns(column_data, columns).to_csv(temp_file)
+
+        expected = io.StringIO(newline='')
+        writer = csv.writer(expected)
+        writer.writerow(columns)
+        writer.writerows(zip(*(column_data[col] for col in columns)))
+        with open(temp_file, newline='', encoding='utf-8') as f:
+            assert f.read() == expected.getvalue()
+
+    def test_write_csv_columns(self, tmp_path):
+        """Test writing column lists directly with the CSV handler."""
+        from tempdataset.core.io.csv_handler import write_csv_columns
+        temp_file = tmp_path / "columns.csv"
+
+        write_csv_columns([["Alice", "Bob, Jr."], [25, 30]], str(temp_file), ["name", "age"])
+        assert temp_file.read_text(encoding='utf-8') == 'name,age\nAlice,25\n"Bob, Jr.",30\n'
+        with pytest.raises(ValidationError):
+            write_csv_columns([["Alice"]], str(temp_file), ["name", "age"])
+
+    def test_csv_export_rejects_unknown_keys(self, tmp_path):
+        """Test to_csv fills missing keys but rejects keys outside the columns."""
+        from tempdataset.core.exceptions import CSVWriteError
+        temp_file = str(tmp_path / "out.csv")
+
+        TempDataFrame([{"name": "Alice"}, {"name": "Bob", "age": 30}], ["name", "age"]).to_csv(temp_file)
+        with open(temp_file, newline='', encoding='utf-8') as f:
+            assert f.read() == "name,age\r\nAlice,\r\nBob,30\r\n"
+
+        for extra_row in ({"name": "Bob", "age": 30, "city": "Boston"}, {"name": "Bob", "city": "Boston"}):
+            df = TempDataFrame([{"name": "Alice", "age": 25}, extra_row], ["name", "age"])
+            with pytest.raises(CSVWriteError):
+                df.to_csv(temp_file)
+
     def test_json_export_and_import(self):
         """Test JSON export and import cycle."""
         data = [
@@ -153,6 +260,179 @@ class TestTempDataFrameFileIO:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
 
+    @pytest.mark.parametrize("lines", [False, True])
+    def test_json_writer_matches_stdlib(self, tmp_path, monkeypatch, lines):
+        """Test JSON output is the same with and without orjson."""
+        from tempdataset.core.io import json_handler
+        data = [
+            {"name": "Zoë", "age": 25, "score": 95.5, "tags": ["a", "b"], "note": None},
+            {"name": "Bob", "age": 30, "score": 87.2, "tags": [], "note": "x"},
+            {"name": "Eve", "age": 35, "score": float('nan'), "tags": [float('inf')], "note": -float('inf')}
+        ]
+        fast_file = str(tmp_path / "fast.json")
+        stdlib_file = str(tmp_path / "stdlib.json")
+
+        write_json(data, fast_file, lines=lines)
+        monkeypatch.setattr(json_handler, "orjson", None)
+        write_json(data, stdlib_file, lines=lines)
+
+        with open(fast_file, encoding='utf-8') as f:
+            fast_output = f.read()
+        with open(stdlib_file, encoding='utf-8') as f:
+            assert fast_output == f.read()
+        assert 'NaN' in fast_output and '-Infinity' in fast_output
+
+        rows = read_json(fast_file, lines=lines).to_dict()
+        assert rows[:2] == data[:2]
+        assert rows[2]["score"] != rows[2]["score"]  # NaN
+        assert rows[2]["tags"] == [float('inf')]
+        assert rows[2]["note"] == -float('inf')
+
+    def test_json_non_plain_types_match_stdlib(self, tmp_path, monkeypatch):
+        """Test Enum and UUID values are written the same with and without orjson."""
+        import enum
+        import uuid
+        from tempdataset.core.io import json_handler
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        data = [{"color": Color.RED, "id": uuid.UUID(int=1), "code": 7}]
+        df = TempDataFrame(data, ["color", "id", "code"])
+
+        outputs = []
+        for use_orjson in (True, False):
+            if not use_orjson:
+                monkeypatch.setattr(json_handler, "orjson", None)
+            json_file = tmp_path / f"frame_{use_orjson}.json"
+            df.to_json(str(json_file))
+            outputs.append(json_file.read_text(encoding='utf-8'))
+            with pytest.raises(JSONWriteError):
+                write_json(data, str(tmp_path / "plain.json"))
+
+        assert outputs[0] == outputs[1]
+        assert json.loads(outputs[0]) == [
+            {"color": "Color.RED", "id": "00000000-0000-0000-0000-000000000001", "code": 7}
+        ]
+
+    def test_json_reader_matches_stdlib(self, tmp_path, monkeypatch):
+        """Test JSON input is parsed the same with and without orjson."""
+        from tempdataset.core.io import json_handler
+        from tempdataset.core.exceptions import JSONReadError
+        array_file = tmp_path / "data.json"
+        array_file.write_text('[{"name": "Zoë", "score": NaN, "tags": [1, 2.5]}]', encoding='utf-8')
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text('[{"name": "Alice",}]', encoding='utf-8')
+
+        fast_rows = read_json(str(array_file)).to_dict()
+        with pytest.raises(JSONReadError):
+            read_json(str(bad_file))
+        monkeypatch.setattr(json_handler, "orjson", None)
+        stdlib_rows = read_json(str(array_file)).to_dict()
+        with pytest.raises(JSONReadError):
+            read_json(str(bad_file))
+
+        assert fast_rows[0]["name"] == stdlib_rows[0]["name"] == "Zoë"
+        assert fast_rows[0]["tags"] == stdlib_rows[0]["tags"] == [1, 2.5]
+        assert fast_rows[0]["score"] != fast_rows[0]["score"]  # NaN
+
+    def test_json_format_detection(self, tmp_path):
+        """Test read_json detects arrays, single objects and JSON lines."""
+        array_file = tmp_path / "array.json"
+        array_file.write_text('\n [{"a": 1}, {"a": 2}]')
+        object_file = tmp_path / "object.json"
+        object_file.write_text('{\n  "a": 1\n}\n')
+        lines_file = tmp_path / "lines.json"
+        lines_file.write_text('{"a": 1}\n{"a": 2}\n')
+
+        assert read_json(str(array_file)).to_dict() == [{"a": 1}, {"a": 2}]
+        assert read_json(str(object_file)).to_dict() == [{"a": 1}]
+        assert read_json(str(lines_file)).to_dict() == [{"a": 1}, {"a": 2}]
+
+    def test_json_lines_nrows(self, tmp_path):
+        """Test reading only the first rows of a JSON lines file."""
+        lines_file = tmp_path / "lines.json"
+        lines_file.write_text('{"a": 1}\n\n{"a": 2}\n{"a": 3}\nnot json\n')
+
+        df = read_json(str(lines_file), lines=True, nrows=2)
+        assert df.to_dict() == [{"a": 1}, {"a": 2}]
+
+        with pytest.raises(ValidationError):
+            read_json(str(lines_file), nrows=2)
+        with pytest.raises(ValidationError):
+            read_json(str(lines_file), lines=True, nrows=0)
+
+    def test_json_read_share_strings(self, tmp_path):
+        """Test share_strings makes repeated values share one string object."""
+        json_file = tmp_path / "data.json"
+        write_json([{"id": i, "status": "active"} for i in range(100)], str(json_file))
+
+        plain = read_json(str(json_file))
+        shared = read_json(str(json_file), share_strings=True)
+        assert shared.to_dict() == plain.to_dict()
+
+        statuses = shared._column_values("status")
+        assert all(value is statuses[0] for value in statuses)
+        with pytest.raises(ValidationError):
+            read_json(str(json_file), share_strings="yes")
+
+    def test_failed_write_keeps_existing_file(self, tmp_path):
+        """Test that a failed JSON write leaves the previous file intact."""
+        json_file = tmp_path / "data.json"
+        write_json([{"a": 1}], str(json_file))
+        original = json_file.read_text()
+
+        with pytest.raises(JSONWriteError):
+            write_json([{"a": object()}], str(json_file))
+
+        assert json_file.read_text() == original
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_failed_streaming_write_keeps_existing_files(self, tmp_path):
+        """Test that a failed streaming write touches neither the target nor user files."""
+        from tempdataset.core.io.json_handler import write_json_streaming
+        json_file = tmp_path / "data.json"
+        user_file = tmp_path / "data.json.tmp"
+        write_json([{"a": 1}], str(json_file))
+        user_file.write_text("keep")
+        original = json_file.read_text()
+
+        def rows():
+            yield {"a": 2}
+            raise RuntimeError("generator failed")
+
+        with pytest.raises(JSONWriteError):
+            write_json_streaming(rows(), str(json_file))
+
+        assert json_file.read_text() == original
+        assert user_file.read_text() == "keep"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["data.json", "data.json.tmp"]
+
+    def test_parquet_export(self, tmp_path):
+        """Test Parquet export when pyarrow is available."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        df = TempDataFrame.from_columns(
+            {"name": ["Alice", "Bob"], "age": [25, 30]}, ["name", "age"]
+        )
+        temp_file = str(tmp_path / "data.parquet")
+
+        df.to_parquet(temp_file)
+
+        table = pq.read_table(temp_file)
+        assert table.column_names == ["name", "age"]
+        assert table.to_pydict() == {"name": ["Alice", "Bob"], "age": [25, 30]}
+
+    def test_parquet_export_without_pyarrow(self, tmp_path, monkeypatch):
+        """Test Parquet export reports a missing pyarrow dependency."""
+        import sys
+        from tempdataset.core.exceptions import ParquetWriteError
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        df = TempDataFrame([{"name": "Alice"}], ["name"])
+
+        with pytest.raises(ParquetWriteError) as exc_info:
+            df.to_parquet(str(tmp_path / "data.parquet"))
+        assert "pyarrow" in str(exc_info.value)
+
 
 class TestSalesDatasetGeneration:
     """Test SalesDataset generation functionality."""
@@ -169,7 +449,24 @@ class TestSalesDatasetGeneration:
         for row in data:
             assert isinstance(row, dict)
             assert len(row) > 0
-    
+
+    def test_sales_dataset_column_generation(self):
+        """Test SalesDataset column-oriented generation."""
+        dataset = SalesDataset(rows=5)
+        columns = dataset.generate_columns()
+
+        assert list(columns.keys()) == list(dataset.get_schema().keys())
+        assert all(len(values) == 5 for values in columns.values())
+
+        # Bulk-generated pricing columns keep the same relationships as rows
+        for i in range(5):
+            assert 1 <= columns['quantity'][i] <= 10
+            expected_total = columns['quantity'][i] * columns['unit_price'][i]
+            assert abs(columns['total_price'][i] - expected_total) < 0.1
+            expected_final = columns['total_price'][i] - columns['discount'][i]
+            assert abs(columns['final_price'][i] - expected_final) < 0.02
+            assert 0 <= columns['profit'][i] <= columns['final_price'][i]
+
     def test_sales_dataset_required_columns(self):
         """Test that SalesDataset generates required columns."""
         dataset = SalesDataset(rows=3)
@@ -278,9 +575,9 @@ class TestDataConsistencyValidation:
         data = dataset.generate()
         
         for row in data:
-            order_date = datetime.strptime(row['order_date'], '%Y-%m-%d')
-            ship_date = datetime.strptime(row['ship_date'], '%Y-%m-%d')
-            delivery_date = datetime.strptime(row['delivery_date'], '%Y-%m-%d')
+            order_date = date.fromisoformat(row['order_date'])
+            ship_date = date.fromisoformat(row['ship_date'])
+            delivery_date = date.fromisoformat(row['delivery_date'])
             
             # Test chronological order: order_date <= ship_date <= delivery_date
             assert order_date <= ship_date, \
@@ -293,14 +590,18 @@ class TestDataConsistencyValidation:
         dataset = SalesDataset(rows=10)
         data = dataset.generate()
         
-        # Get expected values from dataset
-        expected_regions = dataset.regions
-        expected_segments = dataset.customer_segments
-        expected_priorities = dataset.order_priorities
-        expected_shipping_modes = dataset.shipping_modes
-        expected_payment_methods = dataset.payment_methods
-        expected_genders = dataset.genders
-        expected_categories = list(dataset.categories.keys())
+        # Get expected values from dataset as sets for hashed lookups
+        expected_regions = frozenset(dataset.regions)
+        expected_segments = frozenset(dataset.customer_segments)
+        expected_priorities = frozenset(dataset.order_priorities)
+        expected_shipping_modes = frozenset(dataset.shipping_modes)
+        expected_payment_methods = frozenset(dataset.payment_methods)
+        expected_genders = frozenset(dataset.genders)
+        expected_categories = frozenset(dataset.categories)
+        expected_subcategories_by_category = {
+            category: frozenset(subcategories)
+            for category, subcategories in dataset.categories.items()
+        }
         
         for row in data:
             # Test that categorical values are from predefined lists
@@ -313,7 +614,7 @@ class TestDataConsistencyValidation:
             assert row['category'] in expected_categories
             
             # Test subcategory is valid for the category
-            expected_subcategories = dataset.categories[row['category']]
+            expected_subcategories = expected_subcategories_by_category[row['category']]
             assert row['subcategory'] in expected_subcategories
     
     def test_numeric_ranges_consistency(self):
@@ -343,11 +644,8 @@ class TestDataConsistencyValidation:
         dataset = SalesDataset(rows=5)
         data = dataset.generate()
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        for row in data:
-            assert re.match(email_pattern, row['customer_email']), \
-                f"Invalid email format: {row['customer_email']}"
+        invalid = [row['customer_email'] for row in data if not _EMAIL_RE.match(row['customer_email'])]
+        assert not invalid, f"Invalid email format: {invalid}"
 
 
 class TestMainAPIIntegration:
@@ -385,6 +683,20 @@ class TestMainAPIIntegration:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
     
+    def test_tempdataset_stream_to_file(self, tmp_path):
+        """Test streaming file output without building a TempDataFrame."""
+        temp_csv = str(tmp_path / "sales.csv")
+        temp_json = str(tmp_path / "sales.json")
+        
+        assert tempdataset.create_dataset(temp_csv, rows=4, stream=True) is None
+        assert tempdataset.create_dataset(temp_json, rows=4, stream=True) is None
+        
+        csv_df = read_csv(temp_csv)
+        json_df = read_json(temp_json)
+        assert csv_df.shape == (4, len(SalesDataset(1).get_schema()))
+        assert json_df.shape == csv_df.shape
+        assert json_df.columns == csv_df.columns
+    
     def test_read_functions(self):
         """Test read_csv() and read_json() functions."""
         # Create test data
@@ -415,6 +727,75 @@ class TestMainAPIIntegration:
             for temp_file in [temp_csv, temp_json]:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
+    
+    def test_seeded_generator_is_reproducible(self):
+        """Test that a seeded DataGenerator produces identical datasets."""
+        from tempdataset.core.generator import DataGenerator
+        
+        def generate(seed):
+            generator = DataGenerator(seed=seed)
+            generator.register_dataset('sales', SalesDataset)
+            return generator.generate('sales', 20).to_dict()
+        
+        assert generate(7) == generate(7)
+        assert generate(7) != generate(8)
+    
+    def test_seeded_batches_do_not_overlap(self, monkeypatch):
+        """Test that batches of neighbouring generator seeds differ."""
+        from tempdataset.core import generator as generator_module
+        from tempdataset.core.generator import DataGenerator
+        from tempdataset.core.utils.performance import optimize_for_large_datasets
+        
+        def batched_settings(rows):
+            settings = optimize_for_large_datasets(rows)
+            settings.update(use_batching=True, batch_size=5)
+            return settings
+        
+        monkeypatch.setattr(generator_module, "optimize_for_large_datasets", batched_settings)
+        
+        def generate(seed):
+            generator = DataGenerator(seed=seed)
+            generator.register_dataset('sales', SalesDataset)
+            return generator.generate('sales', 20).to_dict()
+        
+        assert generate(7) == generate(7)
+        assert generate(7)[5:10] != generate(8)[:5]
+    
+    def test_seeded_file_output_matches_memory(self, tmp_path):
+        """Test that a seeded file dataset has the same rows as in memory."""
+        from tempdataset.core.generator import DataGenerator
+        
+        def generate(name):
+            generator = DataGenerator(seed=7)
+            generator.register_dataset('sales', SalesDataset)
+            return generator.generate(name, 5)
+        
+        expected = generate('sales').to_dict()
+        json_file = str(tmp_path / "sales.json")
+        
+        assert generate(json_file).to_dict() == expected
+        assert read_json(json_file).to_dict() == expected
+    
+    def test_generator_schema_for_filename(self):
+        """Test get_schema resolves dataset names and output filenames alike."""
+        generator = tempdataset._generator
+        schema = generator.get_schema('crm')
+        
+        assert list(schema) == tempdataset.create_dataset('crm', 1).columns
+        assert generator.get_schema('exports/crm_data.json') == schema
+        with pytest.raises(TempDatasetError):
+            generator.get_schema('nonexistent')
+    
+    def test_dataset_registry_frozen(self):
+        """Test that the built-in dataset registry is read-only after import."""
+        generator = tempdataset._generator
+        assert 'sales' in generator.datasets
+        
+        with pytest.raises(TempDatasetError):
+            generator.register_dataset('custom', SalesDataset)
+        with pytest.raises(TypeError):
+            generator.datasets['custom'] = SalesDataset
+        assert 'custom' not in generator.datasets
 
 
 if __name__ == "__main__":